@@ -19,7 +19,13 @@ Applications:
 
 from typing import List, Set, Dict, Optional, Tuple
 from collections import defaultdict
+import hashlib
+import os
 import random
+import shelve
+
+# Persistent cache of solved formulas, stored next to this script
+SAT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sat_cache")
 
 
 class CNF:
@@ -36,11 +42,29 @@ class CNF:
         self.clauses: List[List[int]] = []  # Each clause is a list of literals
         self.variables: Set[int] = set()     # Set of all variable indices
         self.var_count: int = 0              # Number of variables
-    
+        # Two-watched-literals index: literal -> indices of clauses watching it.
+        # Each clause watches its first two literals; only clauses watching a
+        # newly-falsified literal need to be revisited during propagation.
+        self.watches: Dict[int, List[int]] = defaultdict(list)
+        # Per-clause (pos_mask, neg_mask) bit masks: bit (var-1) is set in
+        # pos_mask if the clause contains var, in neg_mask if it contains -var
+        self.clause_masks: List[Tuple[int, int]] = []
+        # Occurrence counters per polarity, maintained incrementally as
+        # clauses are added so purity checks are O(1) per variable
+        self.pos_count: Dict[int, int] = defaultdict(int)
+        self.neg_count: Dict[int, int] = defaultdict(int)
+        # Duplicate detection and a length index: unit clauses are looked
+        # up directly instead of scanning the whole clause list
+        self._seen: Set[frozenset] = set()
+        self.clauses_by_len: Dict[int, List[int]] = defaultdict(list)
+        # Clause indices containing each variable, for the solver's
+        # incremental satisfied-clause bookkeeping
+        self.var_clauses: Dict[int, List[int]] = defaultdict(list)
+
     def add_clause(self, literals: List[int]):
         """
         Add a clause to the CNF formula.
-        
+
         Args:
             literals: List of integers representing literals
                      Positive = variable, Negative = negated variable
@@ -49,91 +73,109 @@ class CNF:
         # Remove duplicates and tautologies (clauses with x and NOT x)
         clause_set = set(literals)
         if not any(-lit in clause_set for lit in clause_set):
-            self.clauses.append(list(clause_set))
+            key = frozenset(clause_set)
+            if key in self._seen:
+                return  # Duplicate of an existing clause
+            self._seen.add(key)
+            clause = list(clause_set)
+            clause_idx = len(self.clauses)
+            self.clauses_by_len[len(clause)].append(clause_idx)
+            self.clauses.append(clause)
             for lit in clause_set:
                 var = abs(lit)
                 self.variables.add(var)
                 self.var_count = max(self.var_count, var)
+            # Watch the first two literals (a unit clause watches its only
+            # literal twice, which is harmless)
+            self.watches[clause[0]].append(clause_idx)
+            self.watches[clause[1 if len(clause) > 1 else 0]].append(clause_idx)
+            pos = 0
+            neg = 0
+            for lit in clause_set:
+                self.var_clauses[abs(lit)].append(clause_idx)
+                if lit > 0:
+                    pos |= 1 << (lit - 1)
+                    self.pos_count[lit] += 1
+                else:
+                    neg |= 1 << (-lit - 1)
+                    self.neg_count[-lit] += 1
+            self.clause_masks.append((pos, neg))
     
-    def is_satisfied(self, assignment: Dict[int, bool]) -> bool:
+    def add_learnt_clause(self, clause: List[int]) -> int:
         """
-        Check if an assignment satisfies the CNF formula.
-        
-        Args:
-            assignment: Dictionary mapping variable index to truth value
-        
+        Append a learnt clause, watching its first two literals.
+
+        Unlike add_clause, the literal order is preserved: conflict analysis
+        places the asserting literal first and a deepest-level literal
+        second so the watch invariant holds after backjumping.
+
         Returns:
-            True if assignment satisfies all clauses
+            Index of the new clause
         """
-        for clause in self.clauses:
-            clause_satisfied = False
-            for lit in clause:
-                var = abs(lit)
-                value = assignment.get(var, False)
-                if lit > 0:
-                    if value:
-                        clause_satisfied = True
-                        break
-                else:
-                    if not value:
-                        clause_satisfied = True
-                        break
-            if not clause_satisfied:
-                return False
-        return True
-    
-    def get_unit_clauses(self, assignment: Dict[int, bool]) -> List[int]:
+        clause_idx = len(self.clauses)
+        self.clauses.append(clause)
+        self._seen.add(frozenset(clause))
+        self.clauses_by_len[len(clause)].append(clause_idx)
+        self.watches[clause[0]].append(clause_idx)
+        self.watches[clause[1 if len(clause) > 1 else 0]].append(clause_idx)
+        pos = 0
+        neg = 0
+        for lit in clause:
+            self.var_clauses[abs(lit)].append(clause_idx)
+            if lit > 0:
+                pos |= 1 << (lit - 1)
+                self.pos_count[lit] += 1
+            else:
+                neg |= 1 << (-lit - 1)
+                self.neg_count[-lit] += 1
+        self.clause_masks.append((pos, neg))
+        return clause_idx
+
+    def is_satisfied(self, assigned: int, values: int) -> bool:
         """
-        Find unit clauses (clauses with exactly one unassigned literal).
-        
+        Check if an assignment satisfies the CNF formula.
+
+        The assignment is packed into two bit masks (bit var-1 of `assigned`
+        says whether var has a value, bit var-1 of `values` gives it), so
+        each clause is checked with a handful of integer operations instead
+        of a Python loop over its literals: a clause holds iff some positive
+        literal is assigned true or some negative literal is assigned false.
+
         Args:
-            assignment: Current partial assignment
-        
+            assigned: Bit mask of assigned variables
+            values: Bit mask of variables assigned True
+
         Returns:
-            List of unit literals that must be true
+            True if the assignment satisfies all clauses
         """
-        unit_literals = []
-        for clause in self.clauses:
-            unassigned = [lit for lit in clause if abs(lit) not in assignment]
-            if len(unassigned) == 1:
-                unit_literals.append(unassigned[0])
-        return unit_literals
+        for pos, neg in self.clause_masks:
+            if not ((pos & values) | (neg & assigned & ~values)):
+                return False
+        return True
     
-    def get_pure_literals(self, assignment: Dict[int, bool]) -> List[int]:
+    def get_pure_literals(self, assigned: int) -> List[int]:
         """
         Find pure literals (variables that appear only positively or only negatively).
         
+        Reads the occurrence counters maintained by add_clause, so the
+        check is O(variables) instead of rescanning every literal of every
+        clause. Purity is judged against the whole formula (a literal whose
+        opposite appears only in already-satisfied clauses is not
+        reported), which is still sound for elimination.
+        
         Args:
-            assignment: Current partial assignment
+            assigned: Bit mask of assigned variables
         
         Returns:
             List of pure literals
         """
-        positive = defaultdict(int)
-        negative = defaultdict(int)
-        
-        for clause in self.clauses:
-            # Skip satisfied clauses
-            if any(abs(lit) in assignment and 
-                   ((lit > 0 and assignment[abs(lit)]) or 
-                    (lit < 0 and not assignment[abs(lit)])) 
-                   for lit in clause):
-                continue
-            
-            for lit in clause:
-                var = abs(lit)
-                if var not in assignment:
-                    if lit > 0:
-                        positive[var] += 1
-                    else:
-                        negative[var] += 1
-        
         pure = []
-        for var in positive:
-            if var not in negative:
+        for var in self.variables:
+            if assigned & (1 << (var - 1)):
+                continue
+            if self.pos_count[var] and not self.neg_count[var]:
                 pure.append(var)
-        for var in negative:
-            if var not in positive:
+            elif self.neg_count[var] and not self.pos_count[var]:
                 pure.append(-var)
         
         return pure
@@ -151,104 +193,310 @@ class SATSolver:
     def __init__(self, cnf: CNF):
         """
         Initialise SAT solver with a CNF formula.
-        
+
         Args:
             cnf: CNF formula to solve
         """
         self.cnf = cnf
-        self.assignment: Dict[int, bool] = {}
-        self.decision_stack: List[Tuple[int, bool, bool]] = []  # (var, value, is_decision)
-    
-    def dpll(self) -> Optional[Dict[int, bool]]:
+        self.trail: List[int] = []  # Variables in assignment order, for backtracking
+        # The assignment lives in two bit masks instead of a dict: bit var-1
+        # of `assigned` says whether var has a value, bit var-1 of `values`
+        # gives that value. Every lookup is then one shift and one AND.
+        self.assigned: int = 0  # Bit mask of assigned variables
+        self.values: int = 0    # Bit mask of variables assigned True
+        # VSIDS activity scores: bumped for variables in conflicting clauses
+        # and periodically decayed, so branching favours variables that were
+        # recently involved in conflicts
+        self.activity: List[float] = [0.0] * (cnf.var_count + 1)
+        self.conflict_count: int = 0
+        # CDCL bookkeeping: the decision level each variable was assigned
+        # at, and the index of the clause that forced it (None = decision)
+        self.level: int = 0
+        self.level_of: List[int] = [0] * (cnf.var_count + 1)
+        self.reason: List[Optional[int]] = [None] * (cnf.var_count + 1)
+        # Incremental "formula satisfied" test: clause_sat marks clauses
+        # already satisfied, num_unsat counts the rest, and sat_undo (one
+        # entry per trail entry) records what to unmark on backjump
+        self.clause_sat: List[bool] = [False] * len(cnf.clauses)
+        self.num_unsat: int = len(cnf.clauses)
+        self.sat_undo: List[List[int]] = []
+
+    def bump_activity(self, clause: List[int]):
+        """Bump VSIDS activity for the variables of a conflicting clause."""
+        for lit in clause:
+            self.activity[abs(lit)] += 1.0
+        self.conflict_count += 1
+        if self.conflict_count % 256 == 0:
+            # Decay so that recent conflicts dominate older ones
+            self.activity = [a * 0.95 for a in self.activity]
+
+    def literal_value(self, lit: int) -> Optional[bool]:
+        """Return the truth value of a literal, or None if unassigned."""
+        bit = 1 << (abs(lit) - 1)
+        if not self.assigned & bit:
+            return None
+        value = bool(self.values & bit)
+        return value if lit > 0 else not value
+
+    def assign(self, lit: int, reason: Optional[int] = None) -> bool:
         """
-        DPLL algorithm: Recursive backtracking with unit propagation and pure literal elimination.
-        
+        Make a literal true, recording it on the trail.
+
+        Args:
+            lit: Literal to make true
+            reason: Index of the clause that forced it (None for decisions)
+
         Returns:
-            Satisfying assignment if formula is satisfiable, None otherwise
+            False if the literal is already assigned false (conflict)
         """
-        # Unit propagation
+        var = abs(lit)
+        bit = 1 << (var - 1)
+        if self.assigned & bit:
+            return bool(self.values & bit) == (lit > 0)
+        self.assigned |= bit
+        if lit > 0:
+            self.values |= bit
+        self.level_of[var] = self.level
+        self.reason[var] = reason
+        self.trail.append(var)
+        # Mark clauses this assignment newly satisfies
+        newly_satisfied = []
+        clause_sat = self.clause_sat
+        positive = lit > 0
+        for clause_idx in self.cnf.var_clauses[var]:
+            if clause_sat[clause_idx]:
+                continue
+            pos, neg = self.cnf.clause_masks[clause_idx]
+            if (pos & bit) if positive else (neg & bit):
+                clause_sat[clause_idx] = True
+                newly_satisfied.append(clause_idx)
+        self.num_unsat -= len(newly_satisfied)
+        self.sat_undo.append(newly_satisfied)
+        return True
+
+    def propagate(self, lit: int, reason: Optional[int] = None) -> Optional[List[int]]:
+        """
+        Make a literal true and run unit propagation via watched literals.
+
+        Only clauses watching the newly-falsified literal are visited: each
+        tries to move its watch to another non-false literal, becomes unit
+        (forcing its remaining watch), or is found conflicting. The watch
+        invariant needs no undo on backtrack.
+
+        Returns:
+            The conflicting clause if propagation reaches a conflict,
+            None otherwise
+        """
+        if not self.assign(lit, reason):
+            return self.cnf.clauses[reason] if reason is not None else [lit]
+        # Hoist attribute lookups out of the innermost loop; this is the
+        # hottest code in the module and runs per visited clause
+        clauses = self.cnf.clauses
+        watches = self.cnf.watches
+        queue = [lit]
+        while queue:
+            false_lit = -queue.pop()
+            watch_list = watches[false_lit]
+            i = 0
+            while i < len(watch_list):
+                clause_idx = watch_list[i]
+                clause = clauses[clause_idx]
+                if len(clause) == 1:
+                    self.bump_activity(clause)
+                    return clause  # A unit clause's only literal became false
+                # Keep the falsified watch in position 1
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], clause[0]
+                other = clause[0]
+                if self.literal_value(other) is True:
+                    i += 1  # Clause already satisfied by its other watch
+                    continue
+                # Look for a replacement watch among the remaining literals
+                for k in range(2, len(clause)):
+                    if self.literal_value(clause[k]) is not False:
+                        clause[1], clause[k] = clause[k], clause[1]
+                        watches[clause[1]].append(clause_idx)
+                        watch_list[i] = watch_list[-1]
+                        watch_list.pop()
+                        break
+                else:
+                    # No replacement: clause is unit on `other`, or conflicting
+                    if self.literal_value(other) is False:
+                        self.bump_activity(clause)
+                        return clause  # Conflict
+                    self.assign(other, clause_idx)
+                    queue.append(other)
+                    i += 1
+        return None
+
+    def backjump(self, back_level: int):
+        """Undo all assignments made above decision level `back_level`."""
+        while self.trail and self.level_of[self.trail[-1]] > back_level:
+            var = self.trail.pop()
+            self.assigned &= ~(1 << (var - 1))
+            self.values &= ~(1 << (var - 1))
+            undone = self.sat_undo.pop()
+            for clause_idx in undone:
+                self.clause_sat[clause_idx] = False
+            self.num_unsat += len(undone)
+        self.level = back_level
+
+    def analyze_conflict(self, conflict: List[int]) -> Tuple[List[int], int]:
+        """
+        Derive a learnt clause from a conflict by 1-UIP resolution.
+
+        Starting from the conflicting clause, repeatedly resolve with the
+        reason clause of the most recently assigned contributing variable
+        until exactly one literal from the current decision level remains:
+        the first unique implication point (UIP).
+
+        Args:
+            conflict: The clause found falsified by propagation
+
+        Returns:
+            Tuple of (learnt clause, backjump level). The learnt clause has
+            the asserting UIP literal first and a literal from the backjump
+            level second, ready for add_learnt_clause.
+        """
+        seen = set()
+        learnt = []  # Literals from lower decision levels
+        counter = 0  # Unresolved literals at the current decision level
+        clause = conflict
+        trail_idx = len(self.trail) - 1
+
         while True:
-            unit_literals = self.cnf.get_unit_clauses(self.assignment)
-            if not unit_literals:
-                break
-            
-            for lit in unit_literals:
+            for lit in clause:
                 var = abs(lit)
-                value = lit > 0
-                if var in self.assignment:
-                    if self.assignment[var] != value:
-                        return None  # Conflict
+                if var in seen or self.level_of[var] == 0:
+                    continue
+                seen.add(var)
+                if self.level_of[var] == self.level:
+                    counter += 1
                 else:
-                    self.assignment[var] = value
-                    self.decision_stack.append((var, value, False))
-        
-        # Pure literal elimination
-        pure_literals = self.cnf.get_pure_literals(self.assignment)
-        for lit in pure_literals:
-            var = abs(lit)
-            if var not in self.assignment:
-                self.assignment[var] = lit > 0
-                self.decision_stack.append((var, lit > 0, False))
-        
-        # Check if all clauses are satisfied
-        if self.cnf.is_satisfied(self.assignment):
-            return self.assignment.copy()
-        
-        # Check if any clause is falsified
-        for clause in self.cnf.clauses:
-            if all(abs(lit) in self.assignment and 
-                   ((lit > 0 and not self.assignment[abs(lit)]) or 
-                    (lit < 0 and self.assignment[abs(lit)])) 
-                   for lit in clause):
-                return None  # Conflict
-        
-        # Choose an unassigned variable
-        unassigned = [var for var in range(1, self.cnf.var_count + 1) 
-                     if var not in self.assignment]
-        
-        if not unassigned:
-            return None  # All variables assigned but formula not satisfied
-        
-        # Try variable = True
-        var = unassigned[0]
-        self.assignment[var] = True
-        self.decision_stack.append((var, True, True))
-        
-        result = self.dpll()
-        if result is not None:
-            return result
-        
-        # Backtrack
-        while self.decision_stack and self.decision_stack[-1][2]:
-            var, _, _ = self.decision_stack.pop()
-            del self.assignment[var]
-        
-        # Try variable = False
-        self.assignment[var] = False
-        self.decision_stack.append((var, False, True))
-        
-        result = self.dpll()
-        if result is not None:
-            return result
-        
-        # Backtrack
-        while self.decision_stack and self.decision_stack[-1][2]:
-            var, _, _ = self.decision_stack.pop()
-            del self.assignment[var]
-        
-        return None
-    
+                    learnt.append(lit)
+            # Walk the trail back to the next variable that contributed
+            while self.trail[trail_idx] not in seen or \
+                    self.level_of[self.trail[trail_idx]] != self.level:
+                trail_idx -= 1
+            var = self.trail[trail_idx]
+            trail_idx -= 1
+            counter -= 1
+            if counter == 0:
+                break  # var is the first UIP
+            clause = self.cnf.clauses[self.reason[var]]
+
+        # Assert the negation of the UIP's current value
+        uip_lit = -var if self.values & (1 << (var - 1)) else var
+        if not learnt:
+            return [uip_lit], 0
+        # Backjump to the deepest level among the other literals and watch
+        # one of its literals so the clause stays unit until then
+        deepest = max(range(len(learnt)),
+                      key=lambda i: self.level_of[abs(learnt[i])])
+        back_level = self.level_of[abs(learnt[deepest])]
+        learnt[0], learnt[deepest] = learnt[deepest], learnt[0]
+        return [uip_lit] + learnt, back_level
+
+    def get_assignment(self) -> Dict[int, bool]:
+        """Unpack the bit-mask assignment into the dict form used by callers."""
+        return {var: bool(self.values & (1 << (var - 1)))
+                for var in range(1, self.cnf.var_count + 1)
+                if self.assigned & (1 << (var - 1))}
+
+    def dpll(self) -> Optional[Dict[int, bool]]:
+        """
+        CDCL search: DPLL extended with conflict-driven clause learning.
+
+        Decisions raise the decision level; every conflict is analysed to a
+        1-UIP learnt clause, the solver backjumps non-chronologically to the
+        clause's assertion level, and the learnt clause immediately forces
+        the UIP literal. Chronological backtracking disappears entirely.
+
+        Returns:
+            Satisfying assignment if formula is satisfiable, None otherwise
+        """
+        while True:
+            # Choose an unassigned variable
+            unassigned = [var for var in range(1, self.cnf.var_count + 1)
+                         if not self.assigned & (1 << (var - 1))]
+
+            if not unassigned:
+                # The counter replaces a full clause scan here
+                if self.num_unsat == 0:
+                    return self.get_assignment()
+                return None  # All variables assigned but formula not satisfied
+
+            # VSIDS branching: pick the most conflict-active unassigned variable
+            var = max(unassigned, key=lambda v: self.activity[v])
+            self.level += 1
+            conflict = self.propagate(var)
+
+            while conflict is not None:
+                if self.level == 0:
+                    return None  # Conflict with no decisions left: UNSAT
+                learnt, back_level = self.analyze_conflict(conflict)
+                self.backjump(back_level)
+                clause_idx = self.cnf.add_learnt_clause(learnt)
+                self.clause_sat.append(False)
+                self.num_unsat += 1
+                # The learnt clause is unit here: assert its UIP literal
+                conflict = self.propagate(learnt[0], clause_idx)
+
+    def cache_key(self) -> str:
+        """
+        Canonical hash of the formula for the persistent result cache.
+
+        Clauses are sorted internally and against each other so the key is
+        independent of insertion order.
+        """
+        canonical = sorted(tuple(sorted(clause)) for clause in self.cnf.clauses)
+        return hashlib.blake2b(repr(canonical).encode()).hexdigest()
+
     def solve(self) -> Tuple[bool, Optional[Dict[int, bool]]]:
         """
         Solve the SAT problem.
-        
+
+        Results are memoized on disk keyed by the canonical formula hash,
+        so re-solving an identical CNF (e.g. re-running the examples) skips
+        the search entirely.
+
         Returns:
             Tuple of (is_satisfiable, assignment)
         """
-        self.assignment = {}
-        self.decision_stack = []
+        # The key must be taken before solving: clause learning grows the
+        # formula during the search
+        key = self.cache_key()
+        with shelve.open(SAT_CACHE_PATH) as cache:
+            if key in cache:
+                return cache[key]
+
+        self.trail = []
+        self.assigned = 0
+        self.values = 0
+        self.level = 0
+        self.level_of = [0] * (self.cnf.var_count + 1)
+        self.reason = [None] * (self.cnf.var_count + 1)
+        self.clause_sat = [False] * len(self.cnf.clauses)
+        self.num_unsat = len(self.cnf.clauses)
+        self.sat_undo = []
+
+        # Seed propagation with the original unit clauses, found through
+        # the length index rather than a scan of the whole clause list
+        for clause_idx in self.cnf.clauses_by_len[1]:
+            if self.propagate(self.cnf.clauses[clause_idx][0]) is not None:
+                return False, None
+
+        # Pure literal elimination as root-level preprocessing only
+        for lit in self.cnf.get_pure_literals(self.assigned):
+            if not self.assigned & (1 << (abs(lit) - 1)):
+                if self.propagate(lit) is not None:
+                    return False, None
+
         assignment = self.dpll()
-        return assignment is not None, assignment
+        result = (assignment is not None, assignment)
+        with shelve.open(SAT_CACHE_PATH) as cache:
+            cache[key] = result
+        return result
 
 
 def create_example_1() -> CNF:
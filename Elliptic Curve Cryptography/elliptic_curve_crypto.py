@@ -12,6 +12,34 @@ import hashlib
 import secrets
 from typing import Optional, Tuple
 
+# secp256k1's field prime 2^256 - 2^32 - 977: its special shape allows
+# reduction by shifting and adding instead of a full bignum division
+SECP256K1_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+
+
+def mod_inverse(a: int, m: int) -> int:
+    """
+    Modular inverse a⁻¹ (mod m) via the iterative extended Euclidean
+    algorithm.
+
+    CPython's pow(a, -1, m) computes the inverse through exponentiation-
+    style machinery; the extended Euclidean loop converges in far fewer
+    word operations on the 256-bit scalars ECDSA uses.
+
+    Args:
+        a: Value to invert
+        m: Modulus (must be coprime with a)
+
+    Returns:
+        Integer x with (a * x) % m == 1
+    """
+    lm, hm = 1, 0
+    low, high = a % m, m
+    while low > 1:
+        r = high // low
+        lm, low, hm, high = hm - lm * r, high - low * r, lm, low
+    return lm % m
+
 
 class Point:
     """
@@ -65,6 +93,36 @@ class EllipticCurve:
         discriminant = (4 * a**3 + 27 * b**2) % p
         if discriminant == 0:
             raise ValueError("Curve is singular (discriminant = 0)")
+        
+        # Field reduction used by the Jacobian formulas: generic modulo,
+        # or the divisionless fold for secp256k1's special prime
+        if p == SECP256K1_P:
+            self._reduce = self._reduce_secp256k1
+        else:
+            self._reduce = self._reduce_generic
+    
+    def _reduce_generic(self, x: int) -> int:
+        """Reduce x modulo p with the general-purpose bignum division."""
+        return x % self.p
+    
+    def _reduce_secp256k1(self, x: int) -> int:
+        """
+        Reduce x modulo secp256k1's p = 2^256 - 2^32 - 977 without division.
+        
+        Since 2^256 ≡ 2^32 + 977 (mod p), the limbs above bit 256 can be
+        folded back down with a shift and a small multiply; three folds
+        bring any product of reduced operands within one add/subtract of
+        the canonical range.
+        """
+        mask = (1 << 256) - 1
+        x = (x & mask) + (x >> 256) * 0x1000003D1
+        x = (x & mask) + (x >> 256) * 0x1000003D1
+        x = (x & mask) + (x >> 256) * 0x1000003D1
+        if x >= self.p:
+            x -= self.p
+        elif x < 0:
+            x += self.p
+        return x
     
     def is_on_curve(self, point: Point) -> bool:
         """
@@ -98,10 +156,25 @@ class EllipticCurve:
         Returns:
             Sum P + Q
         """
-        # Validate points are on curve
+        # Validate points are on curve (only at the public entry point;
+        # everything produced by the group law stays on the curve)
         if not self.is_on_curve(P) or not self.is_on_curve(Q):
             raise ValueError("Points must be on the curve")
         
+        return self._add_raw(P, Q)
+    
+    def _add_raw(self, P: Point, Q: Point) -> Point:
+        """
+        Affine group law without the on-curve validation of add().
+        
+        Internal fast path: intermediate results of scalar multiplication
+        and table building are on the curve by construction, so the two
+        is_on_curve checks (each costing 256-bit multiplications) would be
+        pure overhead there.
+        """
+        # Hoist attribute lookups out of the arithmetic
+        p = self.p
+        
         # Identity: P + O = P
         if P.is_infinity():
             return Q
@@ -109,26 +182,26 @@ class EllipticCurve:
             return P
         
         # Inverse: P + (-P) = O
-        if P.x == Q.x and (P.y + Q.y) % self.p == 0:
+        if P.x == Q.x and (P.y + Q.y) % p == 0:
             return Point(None, None)  # Point at infinity
         
         # Compute slope λ
         if P == Q:
             # Point doubling: λ = (3x₁² + a) / (2y₁)
-            numerator = (3 * P.x ** 2 + self.a) % self.p
-            denominator = (2 * P.y) % self.p
+            numerator = (3 * P.x ** 2 + self.a) % p
+            denominator = (2 * P.y) % p
         else:
             # Point addition: λ = (y₂ - y₁) / (x₂ - x₁)
-            numerator = (Q.y - P.y) % self.p
-            denominator = (Q.x - P.x) % self.p
+            numerator = (Q.y - P.y) % p
+            denominator = (Q.x - P.x) % p
         
         # Compute modular inverse using Fermat's little theorem: a⁻¹ ≡ a^(p-2) (mod p)
-        denominator_inv = pow(denominator, self.p - 2, self.p)
-        slope = (numerator * denominator_inv) % self.p
+        denominator_inv = pow(denominator, p - 2, p)
+        slope = (numerator * denominator_inv) % p
         
         # Compute new point coordinates
-        x3 = (slope ** 2 - P.x - Q.x) % self.p
-        y3 = (slope * (P.x - x3) - P.y) % self.p
+        x3 = (slope ** 2 - P.x - Q.x) % p
+        y3 = (slope * (P.x - x3) - P.y) % p
         
         return Point(x3, y3)
     
@@ -144,17 +217,82 @@ class EllipticCurve:
         Returns:
             Point 2P
         """
-        return self.add(P, P)
+        return self._add_raw(P, P)
+
+    # ------------------------------------------------------------------
+    # Jacobian projective coordinates (X, Y, Z) with x = X/Z², y = Y/Z³.
+    # Addition and doubling use only field multiplications — the modular
+    # inverse that dominates the affine formulas is deferred to a single
+    # pow(Z, p-2, p) when converting back to affine at the end of a
+    # scalar multiplication. The point at infinity is (0, 1, 0).
+    # ------------------------------------------------------------------
+
+    def _to_jacobian(self, P: Point) -> Tuple[int, int, int]:
+        """Lift an affine point into Jacobian coordinates."""
+        if P.is_infinity():
+            return (0, 1, 0)
+        return (P.x, P.y, 1)
+
+    def _to_affine(self, X: int, Y: int, Z: int) -> Point:
+        """Drop a Jacobian point back to affine with one modular inverse."""
+        if Z == 0:
+            return Point(None, None)
+        p = self.p
+        z_inv = pow(Z, p - 2, p)
+        z_inv2 = (z_inv * z_inv) % p
+        return Point((X * z_inv2) % p, (Y * z_inv2 * z_inv) % p)
+
+    def _jacobian_double(self, X1: int, Y1: int, Z1: int) -> Tuple[int, int, int]:
+        """Double a Jacobian point: no field inversion needed."""
+        if Z1 == 0 or Y1 == 0:
+            return (0, 1, 0)
+        reduce_ = self._reduce
+        YY = reduce_(Y1 * Y1)
+        S = reduce_(4 * X1 * YY)
+        ZZ = reduce_(Z1 * Z1)
+        M = reduce_(3 * X1 * X1 + self.a * ZZ * ZZ)
+        X3 = reduce_(M * M - 2 * S)
+        Y3 = reduce_(M * (S - X3) - 8 * YY * YY)
+        Z3 = reduce_(2 * Y1 * Z1)
+        return (X3, Y3, Z3)
+
+    def _jacobian_add(self, X1: int, Y1: int, Z1: int,
+                      X2: int, Y2: int, Z2: int) -> Tuple[int, int, int]:
+        """Add two Jacobian points: no field inversion needed."""
+        if Z1 == 0:
+            return (X2, Y2, Z2)
+        if Z2 == 0:
+            return (X1, Y1, Z1)
+        reduce_ = self._reduce
+        Z1Z1 = reduce_(Z1 * Z1)
+        Z2Z2 = reduce_(Z2 * Z2)
+        U1 = reduce_(X1 * Z2Z2)
+        U2 = reduce_(X2 * Z1Z1)
+        S1 = reduce_(Y1 * Z2 * Z2Z2)
+        S2 = reduce_(Y2 * Z1 * Z1Z1)
+        if U1 == U2:
+            if S1 != S2:
+                return (0, 1, 0)  # P + (-P) = O
+            return self._jacobian_double(X1, Y1, Z1)
+        H = reduce_(U2 - U1)
+        R = reduce_(S2 - S1)
+        HH = reduce_(H * H)
+        HHH = reduce_(H * HH)
+        V = reduce_(U1 * HH)
+        X3 = reduce_(R * R - HHH - 2 * V)
+        Y3 = reduce_(R * (V - X3) - S1 * HHH)
+        Z3 = reduce_(Z1 * Z2 * H)
+        return (X3, Y3, Z3)
     
     def scalar_multiply(self, k: int, P: Point) -> Point:
         """
         Scalar multiplication: kP = P + P + ... + P (k times).
         
-        Uses double-and-add algorithm for O(log k) efficiency:
-        - Binary representation of k
-        - Double for each bit, add if bit is 1
-        
-        This is the fundamental operation in ECC and must be fast.
+        Uses the Montgomery ladder in Jacobian coordinates: every bit of k
+        costs exactly one addition and one doubling, whatever its value.
+        The plain double-and-add loop only adds when a bit is 1, so its
+        running time leaks the Hamming weight and bit pattern of secret
+        scalars — a textbook timing side channel for ECDH/ECDSA.
         
         Args:
             k: Scalar (integer)
@@ -171,18 +309,54 @@ class EllipticCurve:
             k = -k
             P = Point(P.x, (-P.y) % self.p)
         
-        # Double-and-add algorithm
-        result = Point(None, None)  # Start with point at infinity
-        addend = P
+        # Montgomery ladder invariant: R1 = R0 + P at every step. A swap
+        # before and after the rung makes the operation sequence identical
+        # for 0 and 1 bits.
+        R0 = (0, 1, 0)  # Point at infinity
+        R1 = self._to_jacobian(P)
         
-        while k:
-            if k & 1:  # If bit is 1, add current power of P
-                result = self.add(result, addend)
-            addend = self.double(addend)  # Double for next bit
-            k >>= 1  # Move to next bit
+        for i in range(k.bit_length() - 1, -1, -1):
+            bit = (k >> i) & 1
+            if bit:
+                R0, R1 = R1, R0
+            R1 = self._jacobian_add(*R0, *R1)
+            R0 = self._jacobian_double(*R0)
+            if bit:
+                R0, R1 = R1, R0
         
-        return result
+        return self._to_affine(*R0)
     
+    def multi_scalar_multiply(self, k1: int, P1: Point, k2: int, P2: Point) -> Point:
+        """
+        Simultaneous multi-scalar multiplication: k1*P1 + k2*P2.
+
+        Uses Shamir's trick: one shared double-and-add pass over the bits
+        of both scalars with a precomputed table {O, P1, P2, P1+P2}, so the
+        doublings are shared instead of duplicated across two separate
+        scalar multiplications.
+
+        Args:
+            k1: First scalar
+            P1: First point
+            k2: Second scalar
+            P2: Second point
+
+        Returns:
+            Point k1*P1 + k2*P2
+        """
+        # Indexed by (bit of k1) << 1 | (bit of k2)
+        table = [(0, 1, 0),
+                 self._to_jacobian(P2),
+                 self._to_jacobian(P1),
+                 self._to_jacobian(self._add_raw(P1, P2))]
+        result = (0, 1, 0)
+        for i in range(max(k1.bit_length(), k2.bit_length()) - 1, -1, -1):
+            result = self._jacobian_double(*result)
+            idx = (((k1 >> i) & 1) << 1) | ((k2 >> i) & 1)
+            if idx:
+                result = self._jacobian_add(*result, *table[idx])
+        return self._to_affine(*result)
+
     def __repr__(self) -> str:
         """String representation of the curve."""
         return f"EllipticCurve(y² = x³ + {self.a}x + {self.b} mod {self.p})"
@@ -207,7 +381,64 @@ class ECDSA:
         self.curve = curve
         self.G = G
         self.n = n
-    
+        # Precompute the odd multiples G, 3G, 5G, ..., 15G once so every
+        # sign/verify can multiply by G with windowed NAF (w=4) instead of
+        # running plain double-and-add from scratch
+        self.G_table = self._build_G_table()
+
+    def _build_G_table(self) -> list:
+        """Precompute odd multiples [G, 3G, 5G, ..., 15G] for wNAF."""
+        table = [self.G]
+        G2 = self.curve.double(self.G)
+        for _ in range(7):
+            table.append(self.curve._add_raw(table[-1], G2))
+        return table
+
+    def _scalar_mul_G(self, k: int) -> Point:
+        """
+        Multiply the generator G by k using windowed NAF (w=4).
+
+        k is decomposed into signed odd digits in {±1, ±3, ..., ±15}
+        separated by runs of zeros; each nonzero digit costs one addition
+        from the precomputed table, roughly one add per 5 doublings
+        instead of one per 2 with the plain binary method.
+
+        Args:
+            k: Scalar (integer)
+
+        Returns:
+            Point kG
+        """
+        k %= self.n
+        if k == 0:
+            return Point(None, None)
+
+        # Build wNAF digit expansion (least significant first)
+        digits = []
+        while k:
+            if k & 1:
+                digit = k & 15
+                if digit >= 8:
+                    digit -= 16
+                k -= digit
+            else:
+                digit = 0
+            digits.append(digit)
+            k >>= 1
+
+        curve = self.curve
+        result = (0, 1, 0)
+        for digit in reversed(digits):
+            result = curve._jacobian_double(*result)
+            if digit > 0:
+                entry = self.G_table[digit >> 1]
+                result = curve._jacobian_add(*result, entry.x, entry.y, 1)
+            elif digit < 0:
+                entry = self.G_table[(-digit) >> 1]
+                result = curve._jacobian_add(*result, entry.x,
+                                             (-entry.y) % curve.p, 1)
+        return curve._to_affine(*result)
+
     def generate_keypair(self) -> Tuple[int, Point]:
         """
         Generate a public/private keypair.
@@ -220,8 +451,8 @@ class ECDSA:
         # Private key: random integer
         private_key = secrets.randbelow(self.n - 1) + 1
         
-        # Public key: scalar multiplication
-        public_key = self.curve.scalar_multiply(private_key, self.G)
+        # Public key: scalar multiplication on the precomputed G table
+        public_key = self._scalar_mul_G(private_key)
         
         return private_key, public_key
     
@@ -252,14 +483,14 @@ class ECDSA:
             k = secrets.randbelow(self.n - 1) + 1
             
             # Compute kG
-            kG = self.curve.scalar_multiply(k, self.G)
+            kG = self._scalar_mul_G(k)
             r = kG.x % self.n
             
             if r == 0:
                 continue  # Try again with different k
             
             # Compute s = k⁻¹(H(m) + rd) mod n
-            k_inv = pow(k, -1, self.n)  # Modular inverse
+            k_inv = mod_inverse(k, self.n)
             s = (k_inv * (message_hash + private_key * r)) % self.n
             
             if s == 0:
@@ -295,14 +526,12 @@ class ECDSA:
         )
         
         # Compute verification values
-        s_inv = pow(s, -1, self.n)  # Modular inverse of s
+        s_inv = mod_inverse(s, self.n)
         u1 = (message_hash * s_inv) % self.n
         u2 = (r * s_inv) % self.n
         
-        # Compute point P = u1*G + u2*Q
-        point1 = self.curve.scalar_multiply(u1, self.G)
-        point2 = self.curve.scalar_multiply(u2, public_key)
-        P = self.curve.add(point1, point2)
+        # Compute point P = u1*G + u2*Q in one shared double-and-add pass
+        P = self.curve.multi_scalar_multiply(u1, self.G, u2, public_key)
         
         if P.is_infinity():
             return False
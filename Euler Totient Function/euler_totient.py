@@ -9,9 +9,50 @@ cryptography, particularly in the RSA encryption algorithm.
 """
 
 import math
-from functools import reduce
+import sys
+from collections import defaultdict
+from functools import lru_cache, reduce
+from itertools import combinations, cycle
 from operator import mul
 
+# Gaps between consecutive mod-30 wheel residues {7,11,13,17,19,23,29,31}:
+# candidates coprime to 2, 3 and 5, visited in order from 7
+WHEEL_235 = (4, 2, 4, 2, 4, 6, 2, 6)
+
+
+def _sieve_small_primes(limit):
+    """Sieve of Eratosthenes returning all primes up to limit as a tuple."""
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytearray(len(sieve[i * i::i]))
+    return tuple(i for i in range(limit + 1) if sieve[i])
+
+
+# Trial-division table: iterating only primes skips the composite
+# candidates the wheel would still try (9 out of 30 per wheel turn)
+SMALL_PRIMES = _sieve_small_primes(65536)
+
+
+def _pack_prime_bits(limit):
+    """Build a bit-packed primality table: bit n set iff n is prime."""
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytearray(len(sieve[i * i::i]))
+    bits = bytearray(limit >> 3)
+    for i in range(limit):
+        if sieve[i]:
+            bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
+
+
+# ~128 KB table answering is_prime in one shift+mask for small n
+PRIME_BITS_LIMIT = 1 << 20
+PRIME_BITS = _pack_prime_bits(PRIME_BITS_LIMIT)
+
 
 def gcd(a, b):
     """
@@ -38,32 +79,99 @@ def prime_factorization(n):
     Returns:
         Dictionary mapping prime factors to their powers
     """
+    # A fresh dict per call keeps the cached result safe from mutation
+    return dict(_prime_factorization_items(n))
+
+
+@lru_cache(maxsize=None)
+def _prime_factorization_items(n):
+    """Cached core of prime_factorization, returning immutable items."""
     if n < 2:
-        return {}
+        return ()
     
     factors = {}
-    d = 2
-    
-    # Check for factor 2
-    while n % 2 == 0:
-        factors[2] = factors.get(2, 0) + 1
-        n //= 2
     
-    # Check for odd factors from 3 onwards
-    d = 3
-    while d * d <= n:
+    # Trial-divide by the precomputed prime table first: every divisor
+    # tried is an actual prime, and the iteration is a C-level tuple walk
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    
+    # Candidates past the table follow the mod-30 wheel: only residues
+    # coprime to 2·3·5 are tried (8 of every 30 numbers instead of 15 of
+    # 30). 65537 ≡ 17 (mod 30), so the gap cycle starts at 17's slot.
+    d = 65537
+    for gap in cycle(WHEEL_235[3:] + WHEEL_235[:3]):
+        if d * d > n:
+            break
         while n % d == 0:
             factors[d] = factors.get(d, 0) + 1
             n //= d
-        d += 2
+        d += gap
     
     # If n is still greater than 1, it's a prime factor
     if n > 1:
         factors[n] = factors.get(n, 0) + 1
     
-    return factors
+    return tuple(sorted(factors.items()))
 
 
+@lru_cache(maxsize=None)
+def is_prime(n):
+    """
+    Deterministic primality test for 64-bit integers.
+    
+    Small n are answered by a bit-packed sieve table built at import.
+    
+    The witness set {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37} is
+    provably sufficient for all n < 2^64, so the test is exact here while
+    running in O(log² n) modular multiplications instead of O(√n) trial
+    divisions.
+    
+    Args:
+        n: Integer to test
+    
+    Returns:
+        True if n is prime
+    """
+    if n < 2:
+        return False
+    
+    # O(1) bit-table lookup covers every small n before any arithmetic
+    if n < PRIME_BITS_LIMIT:
+        return bool(PRIME_BITS[n >> 3] & (1 << (n & 7)))
+    
+    witnesses = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+    for p in witnesses:
+        if n == p:
+            return True
+        if n % p == 0:
+            return False
+    
+    # Write n - 1 as d * 2^s with d odd
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = (x * x) % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
 def euler_totient_basic(n):
     """
     Calculate Euler's totient function φ(n) using the basic counting method.
@@ -78,14 +186,13 @@ def euler_totient_basic(n):
     if n == 1:
         return 1
     
-    count = 0
-    for k in range(1, n + 1):
-        if gcd(k, n) == 1:
-            count += 1
-    
-    return count
+    # math.gcd runs in C, so the per-element cost is the loop itself
+    # rather than an interpreted Euclidean algorithm
+    _gcd = math.gcd
+    return sum(1 for k in range(1, n + 1) if _gcd(k, n) == 1)
 
 
+@lru_cache(maxsize=None)
 def euler_totient_formula(n):
     """
     Calculate Euler's totient function φ(n) using the formula.
@@ -118,15 +225,38 @@ def euler_totient_formula(n):
 def euler_totient_efficient(n):
     """
     Calculate Euler's totient function φ(n) efficiently.
-    Same as euler_totient_formula but optimized.
-    
+
+    Fuses factorization and the product formula into one loop: each
+    prime factor is divided out and applied to the result immediately,
+    so no factor dictionary is built and nothing is cached. Useful when
+    sweeping many distinct n where a cache would only grow.
+
     Args:
         n: Positive integer
-    
+
     Returns:
         φ(n)
     """
-    return euler_totient_formula(n)
+    if n == 1:
+        return 1
+
+    result = n
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        if n % p == 0:
+            while n % p == 0:
+                n //= p
+            result -= result // p
+    if n > 1:
+        # Either prime, or has a factor beyond the table: finish the
+        # factorization only in the (rare) composite case
+        if n < PRIME_BITS_LIMIT or is_prime(n):
+            result -= result // n
+        else:
+            for p, _ in _prime_factorization_items(n):
+                result -= result // p
+    return result
 
 
 def find_coprimes(n, limit=None):
@@ -142,19 +272,45 @@ def find_coprimes(n, limit=None):
     """
     if limit is None:
         limit = n
+
+    # Mark multiples of each prime factor of n instead of computing
+    # gcd(k, n) for every k: O(limit/p) slice writes per factor
+    mask = bytearray([1]) * (limit + 1)
+    mask[0] = 0
+    for p, _ in _prime_factorization_items(n):
+        mask[p::p] = bytearray(len(mask[p::p]))
+    return [k for k in range(1, limit + 1) if mask[k]]
+
+
+def sieve_totients(limit):
+    """
+    Compute φ(n) for every n up to limit with a totient sieve.
     
-    coprimes = []
-    for k in range(1, limit + 1):
-        if gcd(k, n) == 1:
-            coprimes.append(k)
+    Starts from φ(n) = n and, for each prime p, applies the factor
+    (1 - 1/p) to all of its multiples in one pass. One O(n log log n)
+    sweep replaces a full trial-division factorization per number.
+    
+    Args:
+        limit: Largest n to compute (inclusive)
     
-    return coprimes
+    Returns:
+        List phi where phi[n] = φ(n) for 1 <= n <= limit
+    """
+    phi = list(range(limit + 1))
+    for p in range(2, limit + 1):
+        if phi[p] == p:  # p is prime: no smaller prime has touched it
+            for multiple in range(p, limit + 1, p):
+                phi[multiple] -= phi[multiple] // p
+    return phi
 
 
 def euler_totient_range(start, end):
     """
     Calculate φ(n) for all n in a range.
     
+    Uses one shared totient sieve instead of factorizing each n
+    individually.
+    
     Args:
         start: Start of range (inclusive)
         end: End of range (inclusive)
@@ -162,11 +318,8 @@ def euler_totient_range(start, end):
     Returns:
         Dictionary mapping n to φ(n)
     """
-    results = {}
-    for n in range(start, end + 1):
-        results[n] = euler_totient_formula(n)
-    
-    return results
+    phi = sieve_totients(end)
+    return {n: phi[n] for n in range(start, end + 1)}
 
 
 def analyze_totient_properties(n):
@@ -186,14 +339,14 @@ def analyze_totient_properties(n):
         'n': n,
         'phi_n': phi_n,
         'prime_factorization': factors,
-        'is_prime': len(factors) == 1 and factors.get(list(factors.keys())[0], 0) == 1 if factors else False,
+        'is_prime': is_prime(n),
         'ratio': phi_n / n if n > 0 else 0,
     }
     
     # Check if n is a prime power
     if len(factors) == 1:
-        p = list(factors.keys())[0]
-        a = factors[p]
+        # next(iter(...)) grabs the only entry without building a list
+        p, a = next(iter(factors.items()))
         properties['is_prime_power'] = True
         properties['prime_power_base'] = p
         properties['prime_power_exponent'] = a
@@ -206,6 +359,45 @@ def analyze_totient_properties(n):
     return properties
 
 
+def batch_gcd(numbers):
+    """
+    For each number, compute the gcd with the product of all the others.
+
+    Uses a product tree followed by a remainder tree, so the whole batch
+    costs roughly O(M(total bits) · log n) instead of the quadratic cost
+    of pairwise gcds. Useful for spotting shared factors across many
+    moduli at once (the classic attack on RSA keys with shared primes).
+
+    Args:
+        numbers: List of positive integers
+
+    Returns:
+        List where entry i is gcd(numbers[i], product of the rest)
+    """
+    if not numbers:
+        return []
+    if len(numbers) == 1:
+        return [1]
+
+    # Product tree: level 0 is the inputs, each level pairs up the one
+    # below, the root is the product of everything
+    tree = [list(numbers)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i + 1] if i + 1 < len(level)
+                     else level[i]
+                     for i in range(0, len(level), 2)])
+
+    # Remainder tree: push the root down, reducing mod the square of
+    # each node, until each leaf holds (product of all) mod n²
+    remainders = tree[-1]
+    for level in reversed(tree[:-1]):
+        remainders = [remainders[i >> 1] % (value * value)
+                      for i, value in enumerate(level)]
+
+    return [math.gcd(n, r // n) for n, r in zip(numbers, remainders)]
+
+
 def find_totient_pairs(limit):
     """
     Find all pairs (n, m) where φ(n) = φ(m) and n ≠ m (called totient twins).
@@ -216,45 +408,39 @@ def find_totient_pairs(limit):
     Returns:
         List of pairs (n, m) where n < m and φ(n) = φ(m)
     """
-    totients = {}
+    # One shared sieve instead of factorizing each n
+    phi = sieve_totients(limit)
     
-    # Calculate all totient values
+    totients = defaultdict(list)
     for n in range(1, limit + 1):
-        phi_n = euler_totient_formula(n)
-        if phi_n not in totients:
-            totients[phi_n] = []
-        totients[phi_n].append(n)
-    
-    # Find pairs
-    pairs = []
-    for phi_value, numbers in totients.items():
-        if len(numbers) > 1:
-            for i in range(len(numbers)):
-                for j in range(i + 1, len(numbers)):
-                    pairs.append((numbers[i], numbers[j], phi_value))
+        totients[phi[n]].append(n)
     
-    return pairs
+    # Pair enumeration via combinations instead of nested index loops
+    return [(a, b, phi_value)
+            for phi_value, numbers in totients.items()
+            if len(numbers) > 1
+            for a, b in combinations(numbers, 2)]
 
 
 def print_totient_table(start, end, cols=5):
     """Print a table of φ(n) values."""
-    print(f"\n{'=' * 70}")
-    print(f"Euler's Totient Function φ(n) for n = {start} to {end}")
-    print(f"{'=' * 70}")
+    # Accumulate rows and emit one buffered write instead of a print
+    # call (with its own flush) per line
+    lines = ["", "=" * 70,
+             f"Euler's Totient Function φ(n) for n = {start} to {end}",
+             "=" * 70]
     
     results = euler_totient_range(start, end)
     
     items = list(results.items())
     for i in range(0, len(items), cols):
         row = items[i:i + cols]
-        # Print n values
-        n_line = "  ".join(f"n={n:>3}" for n, _ in row)
-        print(f"\n{n_line}")
-        # Print φ(n) values
-        phi_line = "  ".join(f"φ={phi:>3}" for _, phi in row)
-        print(f"{phi_line}")
+        lines.append("")
+        lines.append("  ".join(f"n={n:>3}" for n, _ in row))
+        lines.append("  ".join(f"φ={phi:>3}" for _, phi in row))
     
-    print(f"\n{'=' * 70}")
+    lines += ["", "=" * 70]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_totient_analysis(n):
@@ -402,8 +588,11 @@ def main():
     for m, n in pairs_coprime:
         phi_m = euler_totient_formula(m)
         phi_n = euler_totient_formula(n)
-        phi_mn = euler_totient_formula(m * n)
-        print(f"     φ({m})×φ({n}) = {phi_m}×{phi_n} = {phi_m * phi_n} = φ({m*n}) ✓")
+        # The property being demonstrated lets us skip the third
+        # factorization: gcd(m, n) = 1, so φ(m·n) is exactly φ(m)·φ(n)
+        phi_mn = phi_m * phi_n
+        assert phi_mn == euler_totient_formula(m * n)
+        print(f"     φ({m})×φ({n}) = {phi_m}×{phi_n} = {phi_mn} = φ({m*n}) ✓")
     
     # RSA connection
     demonstrate_rsa_connection()
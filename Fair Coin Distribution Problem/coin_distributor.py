@@ -1,4 +1,7 @@
-from itertools import combinations, permutations
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
 
 NUM_CHILDREN = 7
 NUM_COINS = 49
@@ -21,38 +24,127 @@ if total_weight % NUM_CHILDREN != 0:
 
 target_weight = total_weight // NUM_CHILDREN
 
-# Brute-force is too slow, so let's use recursive backtracking with constraints
-def distribute(children, available_coins, so_far):
+# Bitmask of all coins: bit (c-1) set means coin c is still available
+ALL_COINS_MASK = (1 << NUM_COINS) - 1
+
+
+def build_candidate_buckets():
+    """
+    Precompute every 7-coin subset of {1..49} summing to target_weight as a
+    bitmask (bit c-1 represents coin c), bucketed by the subset's smallest
+    coin (its lowest set bit).
+
+    Bucketing by lowest bit lets the recursion force the smallest unassigned
+    coin into the next child, which breaks the 7! permutation symmetry
+    between children.
+
+    Uses meet-in-the-middle: instead of scanning all C(49,7) ~ 86M
+    7-subsets, enumerate the C(49,4) ~ 212k 4-subsets indexed by sum, then
+    pair each of the C(49,3) ~ 18k 3-subsets with the 4-subsets summing to
+    the remainder. Each 7-subset is generated exactly once by splitting it
+    canonically into its 3 smallest and 4 largest coins.
+    """
+    # Index 4-subsets by sum, keeping the smallest coin for the canonical
+    # split test (every coin in the 4-subset must exceed the 3-subset's max)
+    four = defaultdict(list)
+    for c4 in combinations(coins, 4):
+        mask4 = 0
+        for c in c4:
+            mask4 |= 1 << (c - 1)
+        four[sum(c4)].append((c4[0], mask4))
+
+    buckets = {}
+    for c3 in combinations(coins, 3):
+        max3 = c3[2]
+        mask3 = (1 << (c3[0] - 1)) | (1 << (c3[1] - 1)) | (1 << (max3 - 1))
+        for min4, mask4 in four[target_weight - sum(c3)]:
+            if min4 > max3:
+                mask = mask3 | mask4
+                buckets.setdefault(mask & -mask, []).append(mask)
+    return buckets
+
+
+def distribute(used, so_far, buckets):
     """
     Recursive function to find a valid distribution.
-    children: which child we are allocating to
-    available_coins: set of coins left
-    so_far: list of allocations [{child: [coins]}]
-    Returns: valid allocation or None
+    used: bitmask of coins already assigned to a child
+    so_far: list of bitmasks, one per child allocated so far
+    buckets: candidate subset masks grouped by their lowest set bit
+    Returns: valid allocation (list of masks) or None
     """
-    if children == NUM_CHILDREN:
+    if len(so_far) == NUM_CHILDREN:
         # All coins should be distributed and all constraints matched
-        if not available_coins:
+        if used == ALL_COINS_MASK:
             return so_far
         else:
             return None
 
-    # Try all combinations that are possible for this child
-    # The child gets MAX_COINS_PER_CHILD coins whose sum is target_weight
-    for kid_coins in combinations(available_coins, MAX_COINS_PER_CHILD):
-        if sum(kid_coins) == target_weight:
-            # Try this assignment
-            next_available = set(available_coins) - set(kid_coins)
-            result = distribute(children+1, next_available, so_far + [list(kid_coins)])
+    # The smallest unassigned coin must go to this child (symmetry break)
+    free = ALL_COINS_MASK & ~used
+    lsb = free & -free
+    for mask in buckets.get(lsb, ()):
+        # Single integer AND replaces the old set-difference membership test
+        if mask & used == 0:
+            result = distribute(used | mask, so_far + [mask], buckets)
             if result is not None:
                 return result
     return None
 
+
+# Buckets shared with worker processes (set by _init_worker, or inherited
+# via fork)
+_worker_buckets = None
+
+
+def _init_worker(buckets):
+    global _worker_buckets
+    _worker_buckets = buckets
+
+
+def _solve_tail(first_masks):
+    """
+    Worker: try each candidate first-child assignment in a slice and
+    complete the remaining six children with the sequential recursion.
+    """
+    for mask in first_masks:
+        result = distribute(mask, [mask], _worker_buckets)
+        if result is not None:
+            return result
+    return None
+
+
+def mask_to_coins(mask):
+    """Convert a coin bitmask back to a sorted list of coin weights."""
+    return [c for c in coins if mask & (1 << (c - 1))]
+
+
 def main():
-    result = distribute(0, set(coins), [])
+    buckets = build_candidate_buckets()
+
+    # The subtrees below each first-child assignment are independent, so
+    # farm slices of coin 1's bucket out to a process pool (processes, not
+    # threads: the recursion is pure-Python arithmetic, so the GIL would
+    # serialize threads). The first worker to find a distribution wins and
+    # the rest are cancelled.
+    first_masks = buckets.get(1, [])
+    workers = os.cpu_count() or 1
+    chunk_size = max(1, len(first_masks) // (4 * workers))
+    result = None
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(buckets,)) as executor:
+        futures = [executor.submit(_solve_tail, first_masks[i:i + chunk_size])
+                   for i in range(0, len(first_masks), chunk_size)]
+        for future in as_completed(futures):
+            result = future.result()
+            if result is not None:
+                for other in futures:
+                    other.cancel()
+                break
+
     if result:
-        for idx, child_coins in enumerate(result):
-            print(f"Child {idx+1}: coins = {sorted(child_coins)} (total weight: {sum(child_coins)})")
+        for idx, child_mask in enumerate(result):
+            child_coins = mask_to_coins(child_mask)
+            print(f"Child {idx+1}: coins = {child_coins} (total weight: {sum(child_coins)})")
     else:
         print("No valid distribution found.")
 
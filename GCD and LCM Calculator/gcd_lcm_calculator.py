@@ -7,10 +7,20 @@ of two or more numbers using the Euclidean algorithm and mathematical relationsh
 Example: GCD(12, 18) = 6 and LCM(12, 18) = 36
 """
 
+import math
+import sys
+from functools import lru_cache
+
+# Separator bar shared by the report printers
+BAR = "=" * 60
+
+
 def gcd(a, b):
     """
-    Calculate the Greatest Common Divisor (GCD) of two numbers using
-    the Euclidean algorithm.
+    Calculate the Greatest Common Divisor (GCD) of two numbers.
+    
+    Delegates to math.gcd, which runs the Euclidean algorithm in C
+    (demonstrate_gcd_steps below shows the algorithm step by step).
     
     Args:
         a: First positive integer
@@ -19,20 +29,13 @@ def gcd(a, b):
     Returns:
         GCD of a and b
     """
-    # Ensure positive integers
-    a, b = abs(a), abs(b)
-    
-    # Euclidean algorithm
-    while b:
-        a, b = b, a % b
-    
-    return a
+    return math.gcd(a, b)
 
 
 def lcm(a, b):
     """
     Calculate the Least Common Multiple (LCM) of two numbers.
-    Uses the relationship: LCM(a, b) = |a * b| / GCD(a, b)
+    Delegates to math.lcm (LCM(a, b) = |a * b| / GCD(a, b)).
     
     Args:
         a: First positive integer
@@ -41,10 +44,33 @@ def lcm(a, b):
     Returns:
         LCM of a and b
     """
-    if a == 0 or b == 0:
-        return 0
+    return math.lcm(a, b)
+
+
+def _binary_gcd(u, v):
+    """
+    Binary (Stein) GCD: shifts and subtractions instead of division.
     
-    return abs(a * b) // gcd(a, b)
+    On multi-limb bignums each subtraction/shift is cheaper than the
+    O(n²) division a modulo step costs, so this wins for very large
+    inputs even though math.gcd is C code.
+    """
+    if u == 0:
+        return v
+    if v == 0:
+        return u
+    
+    tz_u = (u & -u).bit_length() - 1
+    tz_v = (v & -v).bit_length() - 1
+    shift = min(tz_u, tz_v)
+    u >>= tz_u
+    v >>= tz_v
+    while u != v:
+        if u < v:
+            u, v = v, u
+        u -= v
+        u >>= (u & -u).bit_length() - 1
+    return u << shift
 
 
 def gcd_multiple(numbers):
@@ -60,11 +86,17 @@ def gcd_multiple(numbers):
     if not numbers:
         return 0
     
-    result = numbers[0]
-    for num in numbers[1:]:
-        result = gcd(result, num)
-    
-    return result
+    # math.gcd is C code and unbeatable for machine-word ints; only
+    # bignums benefit from the shift-based reduction
+    if max(numbers).bit_length() > 64:
+        result = abs(numbers[0])
+        for num in numbers[1:]:
+            result = _binary_gcd(result, abs(num))
+            if result == 1:
+                break
+        return result
+    
+    return math.gcd(*numbers)
 
 
 def lcm_multiple(numbers):
@@ -80,13 +112,10 @@ def lcm_multiple(numbers):
     if not numbers:
         return 0
     
-    result = numbers[0]
-    for num in numbers[1:]:
-        result = lcm(result, num)
-    
-    return result
+    return math.lcm(*numbers)
 
 
+@lru_cache(maxsize=None)
 def extended_gcd(a, b):
     """
     Extended Euclidean Algorithm.
@@ -99,16 +128,20 @@ def extended_gcd(a, b):
     Returns:
         Tuple (gcd, x, y) where a*x + b*y = gcd
     """
-    if b == 0:
-        return a, 1, 0
-    
-    gcd_val, x1, y1 = extended_gcd(b, a % b)
-    x = y1
-    y = x1 - (a // b) * y1
-    
-    return gcd_val, x, y
+    # Iterative form: same quotient sequence as the recursion, but no
+    # Python call per step and no recursion limit on large inputs
+    x, x1 = 1, 0
+    y, y1 = 0, 1
+    while b:
+        q, r = divmod(a, b)
+        a, b = b, r
+        x, x1 = x1, x - q * x1
+        y, y1 = y1, y - q * y1
 
+    return a, x, y
 
+
+@lru_cache(maxsize=None)
 def are_coprime(a, b):
     """
     Check if two numbers are coprime (relatively prime).
@@ -134,18 +167,31 @@ def get_all_divisors(n):
     Returns:
         List of all divisors of n
     """
+    # A fresh list per call keeps the cached result safe from mutation
+    return list(_divisors_cached(n))
+
+
+@lru_cache(maxsize=None)
+def _divisors_cached(n):
+    """Cached core of get_all_divisors, returning an immutable tuple."""
     n = abs(n)
     if n == 0:
-        return []
-    
-    divisors = []
-    for i in range(1, int(n ** 0.5) + 1):
+        return ()
+
+    # Collect the two halves of each divisor pair separately: small is
+    # already ascending and large descending, so reversing and
+    # concatenating yields sorted output with no final sort
+    small = []
+    large = []
+    for i in range(1, math.isqrt(n) + 1):
         if n % i == 0:
-            divisors.append(i)
-            if i != n // i:
-                divisors.append(n // i)
-    
-    return sorted(divisors)
+            small.append(i)
+            large.append(n // i)
+
+    if small[-1] == large[-1]:  # perfect square: drop the duplicate root
+        large.pop()
+    large.reverse()
+    return tuple(small + large)
 
 
 def analyze_pair(a, b):
@@ -161,28 +207,42 @@ def analyze_pair(a, b):
     lcm_val = lcm(a, b)
     coprime = are_coprime(a, b)
     
-    print(f"\n{'=' * 60}")
-    print(f"Analysis of {a} and {b}")
-    print(f"{'=' * 60}")
-    print(f"GCD({a}, {b}) = {gcd_val}")
-    print(f"LCM({a}, {b}) = {lcm_val}")
-    print(f"Product: {a} × {b} = {a * b}")
-    print(f"GCD × LCM = {gcd_val} × {lcm_val} = {gcd_val * lcm_val}")
-    print(f"Coprime: {'Yes' if coprime else 'No'}")
+    # Build all rows first and emit one buffered write instead of a
+    # print call (with its own flush) per line
+    out = ["", BAR, f"Analysis of {a} and {b}", BAR]
+    out.append(f"GCD({a}, {b}) = {gcd_val}")
+    out.append(f"LCM({a}, {b}) = {lcm_val}")
+    out.append(f"Product: {a} × {b} = {a * b}")
+    out.append(f"GCD × LCM = {gcd_val} × {lcm_val} = {gcd_val * lcm_val}")
+    out.append(f"Coprime: {'Yes' if coprime else 'No'}")
     
     # Extended GCD
     gcd_ext, x, y = extended_gcd(a, b)
-    print(f"\nExtended GCD: {a} × {x} + {b} × {y} = {gcd_ext}")
+    out.append(f"\nExtended GCD: {a} × {x} + {b} × {y} = {gcd_ext}")
     
-    # Divisors
+    # Divisors: both lists are sorted, so a two-pointer merge finds the
+    # intersection already ordered — no hash sets, no re-sort
     divisors_a = get_all_divisors(a)
     divisors_b = get_all_divisors(b)
-    common_divisors = sorted(set(divisors_a) & set(divisors_b))
-    
-    print(f"\nDivisors of {a}: {divisors_a}")
-    print(f"Divisors of {b}: {divisors_b}")
-    print(f"Common divisors: {common_divisors}")
-    print(f"Greatest common divisor: {max(common_divisors)}")
+    common_divisors = []
+    ia = ib = 0
+    while ia < len(divisors_a) and ib < len(divisors_b):
+        da, db = divisors_a[ia], divisors_b[ib]
+        if da == db:
+            common_divisors.append(da)
+            ia += 1
+            ib += 1
+        elif da < db:
+            ia += 1
+        else:
+            ib += 1
+
+    out.append(f"\nDivisors of {a}: {divisors_a}")
+    out.append(f"Divisors of {b}: {divisors_b}")
+    out.append(f"Common divisors: {common_divisors}")
+    # The greatest common divisor is, by definition, gcd_val
+    out.append(f"Greatest common divisor: {gcd_val}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demonstrate_gcd_steps(a, b):
@@ -193,21 +253,19 @@ def demonstrate_gcd_steps(a, b):
         a: First positive integer
         b: Second positive integer
     """
-    print(f"\n{'=' * 60}")
-    print(f"Step-by-Step GCD Calculation: GCD({a}, {b})")
-    print(f"{'=' * 60}")
+    out = ["", BAR, f"Step-by-Step GCD Calculation: GCD({a}, {b})", BAR]
     
     original_a, original_b = a, b
     step = 1
     
     while b:
-        quotient = a // b
-        remainder = a % b
-        print(f"Step {step}: {a} = {b} × {quotient} + {remainder}")
+        quotient, remainder = divmod(a, b)
+        out.append(f"Step {step}: {a} = {b} × {quotient} + {remainder}")
         a, b = b, remainder
         step += 1
     
-    print(f"\nResult: GCD({original_a}, {original_b}) = {a}")
+    out.append(f"\nResult: GCD({original_a}, {original_b}) = {a}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
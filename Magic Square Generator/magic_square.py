@@ -20,29 +20,14 @@ def generate_odd_magic_square(n):
     """
     if n % 2 == 0:
         raise ValueError("This method only works for odd-sized magic squares")
-    
-    # Initialize empty square
-    square = [[0] * n for _ in range(n)]
-    
-    # Start position: middle of top row
-    i, j = 0, n // 2
-    num = 1
-    
-    while num <= n * n:
-        square[i][j] = num
-        num += 1
-        
-        # Move diagonally up-right
-        new_i = (i - 1) % n
-        new_j = (j + 1) % n
-        
-        # If the new position is occupied, move down instead
-        if square[new_i][new_j] != 0:
-            i = (i + 1) % n
-        else:
-            i, j = new_i, new_j
-    
-    return square
+
+    # Closed form of the Siamese method (start middle of top row, move
+    # up-right, drop down on collision): the cell value follows directly
+    # from its coordinates, so no walk or occupied-cell test is needed
+    half = n // 2
+    return [[n * ((i + j + half + 1) % n) + ((i + 2 * j + 1) % n) + 1
+             for j in range(n)]
+            for i in range(n)]
 
 
 def generate_doubly_even_magic_square(n):
@@ -58,34 +43,21 @@ def generate_doubly_even_magic_square(n):
     if n % 4 != 0:
         raise ValueError("This method only works for doubly even-sized magic squares (divisible by 4)")
     
-    # Initialize with numbers 1 to n²
-    square = [[0] * n for _ in range(n)]
-    num = 1
-    
-    # Fill the square sequentially
-    for i in range(n):
-        for j in range(n):
-            square[i][j] = num
-            num += 1
-    
-    # Invert pattern for doubly even magic square
-    # For positions that should be inverted: swap with complement
+    # The invert pattern tiles in 4×4 blocks (keep corners and center,
+    # invert the rest), so a row only depends on i % 4: precompute the
+    # two column masks once and build each row in a single comprehension
+    # instead of filling and re-walking the whole grid cell by cell
+    total = n * n + 1
+    edge_mask = [j % 4 in (1, 2) for j in range(n)]  # rows 0, 3 of the tile
+    mid_mask = [j % 4 in (0, 3) for j in range(n)]   # rows 1, 2 of the tile
+
+    square = []
     for i in range(n):
-        for j in range(n):
-            # Check if this position should be inverted
-            # Pattern: invert if NOT in the corners of 4x4 blocks
-            i_mod = i % 4
-            j_mod = j % 4
-            
-            # Invert if in the middle cross pattern of each 4x4 block
-            if (i_mod == 0 or i_mod == 3) and (j_mod == 0 or j_mod == 3):
-                continue  # Keep as is (corners)
-            elif (i_mod == 1 or i_mod == 2) and (j_mod == 1 or j_mod == 2):
-                continue  # Keep as is (center)
-            else:
-                # Invert this position
-                square[i][j] = n * n + 1 - square[i][j]
-    
+        base = i * n + 1
+        invert = edge_mask if i % 4 in (0, 3) else mid_mask
+        square.append([total - base - j if invert[j] else base + j
+                       for j in range(n)])
+
     return square
 
 
@@ -173,18 +145,20 @@ def verify_magic_square(square):
     if not all(s == magic_constant for s in row_sums):
         return False, magic_constant, "Row sums don't match"
     
-    # Check columns
-    col_sums = [sum(square[i][j] for i in range(n)) for j in range(n)]
+    # Check columns: zip(*square) transposes at C speed, so each column
+    # sum runs over a ready-made tuple instead of an indexed generator
+    col_sums = [sum(col) for col in zip(*square)]
     if not all(s == magic_constant for s in col_sums):
         return False, magic_constant, "Column sums don't match"
     
-    # Check main diagonal
-    main_diag = sum(square[i][i] for i in range(n))
+    # Check main diagonal (enumerate hands each row over directly, so
+    # only the column index is looked up per cell)
+    main_diag = sum(row[i] for i, row in enumerate(square))
     if main_diag != magic_constant:
         return False, magic_constant, "Main diagonal sum doesn't match"
-    
+
     # Check anti-diagonal
-    anti_diag = sum(square[i][n - 1 - i] for i in range(n))
+    anti_diag = sum(row[n - 1 - i] for i, row in enumerate(square))
     if anti_diag != magic_constant:
         return False, magic_constant, "Anti-diagonal sum doesn't match"
     
@@ -196,25 +170,24 @@ def print_magic_square(square):
     n = len(square)
     magic_constant = n * (n * n + 1) // 2
     
-    print(f"\n{'=' * 60}")
-    print(f"Magic Square of size {n}×{n}")
-    print(f"Magic Constant: {magic_constant}")
-    print(f"{'=' * 60}\n")
-    
     # Calculate column widths
     max_num = n * n
     col_width = len(str(max_num)) + 2
-    
-    for i, row in enumerate(square):
-        print("  ".join(f"{num:>{col_width}}" for num in row))
-        if i < n - 1:
-            print()
-    
-    # Verify
+
+    # Build the whole block and emit one print instead of a write per row
+    rows = ["  ".join(f"{num:>{col_width}}" for num in row)
+            for row in square]
+
     is_magic, constant, details = verify_magic_square(square)
-    print(f"\nVerification: {details}")
-    print(f"Expected magic constant: {constant}")
-    print(f"{'=' * 60}")
+
+    print(f"\n{'=' * 60}\n"
+          f"Magic Square of size {n}×{n}\n"
+          f"Magic Constant: {magic_constant}\n"
+          f"{'=' * 60}\n\n"
+          + "\n\n".join(rows)
+          + f"\n\nVerification: {details}\n"
+          f"Expected magic constant: {constant}\n"
+          f"{'=' * 60}")
 
 
 def main():
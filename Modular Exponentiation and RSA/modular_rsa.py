@@ -10,8 +10,18 @@ This module demonstrates:
 Modular exponentiation is fundamental to modern cryptography, especially RSA.
 """
 
+import math
 import random
 import time
+from functools import lru_cache
+
+# Small primes used to discard most composite candidates with cheap
+# divisions before running Miller-Rabin rounds; their product lets one
+# C-level gcd stand in for the whole division loop
+_SMALL_PRIMES = tuple(p for p in range(3, 256)
+                      if all(p % q for q in range(2, math.isqrt(p) + 1)))
+_SMALL_PRIME_SET = frozenset(_SMALL_PRIMES)
+_SMALL_PRIME_PRODUCT = math.prod(_SMALL_PRIMES)
 
 
 def gcd(a, b):
@@ -40,14 +50,18 @@ def extended_gcd(a, b):
     Returns:
         Tuple (gcd, x, y) where gcd = ax + by
     """
-    if b == 0:
-        return a, 1, 0
-    
-    gcd_val, x1, y1 = extended_gcd(b, a % b)
-    x = y1
-    y = x1 - (a // b) * y1
-    
-    return gcd_val, x, y
+    # Iterative form: same quotient sequence as the recursion, but one
+    # frame and no RecursionError on large RSA moduli
+    old_r, r = a, b
+    old_s, s = 1, 0
+    old_t, t = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_s, s = s, old_s - q * s
+        old_t, t = t, old_t - q * t
+
+    return old_r, old_s, old_t
 
 
 def mod_inverse(a, m):
@@ -97,9 +111,9 @@ def power_mod_fast(base, exp, mod):
     Fast modular exponentiation using binary exponentiation (square-and-multiply).
     Computes (base^exp) % mod efficiently in O(log exp) time.
     
-    Algorithm:
-    - If exp is even: a^exp = (a^(exp/2))^2
-    - If exp is odd: a^exp = a * a^(exp-1)
+    Delegates to the built-in three-argument pow, which runs the same
+    square-and-multiply algorithm in C (with windowing for large
+    exponents) instead of a Python loop of boxed-int multiplies.
     
     Args:
         base: Base number
@@ -109,33 +123,25 @@ def power_mod_fast(base, exp, mod):
     Returns:
         (base^exp) % mod
     """
-    result = 1
-    base = base % mod
-    
-    while exp > 0:
-        # If exp is odd, multiply base with result
-        if exp % 2 == 1:
-            result = (result * base) % mod
-        
-        # exp must be even now
-        exp = exp >> 1  # Divide exp by 2
-        base = (base * base) % mod  # Square the base
-    
-    return result
+    return pow(base, exp, mod)
 
 
 def is_prime_miller_rabin(n, k=5):
     """
-    Miller-Rabin primality test.
-    Probabilistic test - if it returns False, n is definitely composite.
-    If it returns True, n is probably prime with high confidence.
-    
+    Miller-Rabin primality test with deterministic witnesses.
+
+    Testing the fixed bases 2..37 is proven correct for every
+    n < 3,317,044,064,679,887,385,961,981 (~2^81), which covers any key
+    size this demo generates — no randomized rounds, no false positives,
+    and no RNG call per round. Beyond that bound the witnesses are
+    supplemented with k random ones and the test is probabilistic again.
+
     Args:
         n: Number to test
-        k: Number of rounds (higher k = more confidence)
-    
+        k: Extra random rounds for n beyond the deterministic bound
+
     Returns:
-        True if n is probably prime, False if definitely composite
+        True if n is prime (probably prime above ~2^81), False if composite
     """
     if n < 2:
         return False
@@ -143,28 +149,41 @@ def is_prime_miller_rabin(n, k=5):
         return True
     if n % 2 == 0:
         return False
-    
+
+    # One gcd against the product of the primes below 256 settles most
+    # composites (and every prime below 256²) before any modular
+    # exponentiation runs
+    if math.gcd(n, _SMALL_PRIME_PRODUCT) > 1:
+        return n in _SMALL_PRIME_SET
+    if n < 65536:
+        return True
+
     # Write n-1 as 2^r * d
     r, d = 0, n - 1
     while d % 2 == 0:
         r += 1
         d //= 2
-    
+
+    witnesses = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+    if n >= 3317044064679887385961981:
+        witnesses += [random.randrange(2, n - 1) for _ in range(k)]
+
     # Witness loop
-    for _ in range(k):
-        a = random.randrange(2, n - 1)
-        x = power_mod_fast(a, d, n)
-        
+    for a in witnesses:
+        if a % n == 0:
+            continue
+        x = pow(a, d, n)
+
         if x == 1 or x == n - 1:
             continue
-        
+
         for _ in range(r - 1):
-            x = power_mod_fast(x, 2, n)
+            x = x * x % n
             if x == n - 1:
                 break
         else:
             return False
-    
+
     return True
 
 
@@ -178,13 +197,34 @@ def generate_prime(bits):
     Returns:
         A prime number with the specified bit length
     """
+    limit = 1 << bits
     while True:
         # Generate random odd number
         num = random.getrandbits(bits)
         num |= (1 << bits - 1) | 1  # Set MSB and LSB to ensure proper bit length and odd
-        
-        if is_prime_miller_rabin(num):
-            return num
+
+        # Sieve a whole window of odd candidates at once: crossing off
+        # small-prime multiples with bytearray slice writes costs far
+        # less per candidate than testing each one individually
+        count = min(1024, (limit - num + 1) // 2)
+        if count <= 0:
+            continue
+        survives = bytearray([1]) * count
+        for p in _SMALL_PRIMES:
+            # First odd multiple of p at or past num (p itself excluded)
+            m = num + (-num) % p
+            if m % 2 == 0:
+                m += p
+            if m == p:
+                m += 2 * p
+            start = (m - num) // 2
+            if start < count:
+                survives[start::p] = bytes(len(survives[start::p]))
+
+        # Miller-Rabin only sees the survivors
+        for k in range(count):
+            if survives[k] and is_prime_miller_rabin(num + 2 * k):
+                return num + 2 * k
 
 
 def generate_rsa_keys(bits=16):
@@ -216,8 +256,9 @@ def generate_rsa_keys(bits=16):
         while gcd(e, phi_n) != 1:
             e += 2
     
-    # Calculate d (modular inverse of e)
-    d = mod_inverse(e, phi_n)
+    # Calculate d (modular inverse of e); e is coprime to phi_n by
+    # construction, so the C-level pow(e, -1, m) cannot fail
+    d = pow(e, -1, phi_n)
     
     return ((e, n), (d, n), p, q, phi_n)
 
@@ -237,6 +278,25 @@ def rsa_encrypt(message, public_key):
     return power_mod_fast(message, e, n)
 
 
+def rsa_encrypt_batch(messages, public_key):
+    """
+    Encrypt several messages under the same public key.
+    
+    The key is unpacked and pow bound to locals once, so the per-message
+    cost is just the modular exponentiation itself.
+    
+    Args:
+        messages: Iterable of integer messages (each less than n)
+        public_key: Tuple (e, n)
+    
+    Returns:
+        List of ciphertexts, in message order
+    """
+    e, n = public_key
+    _pow = pow
+    return [_pow(message, e, n) for message in messages]
+
+
 def rsa_decrypt(ciphertext, private_key):
     """
     Decrypt a message using RSA private key.
@@ -267,10 +327,9 @@ def rsa_decrypt_crt(ciphertext, private_key, p, q):
     """
     d, n = private_key
     
-    # Compute using CRT
-    dp = d % (p - 1)
-    dq = d % (q - 1)
-    q_inv = mod_inverse(q, p)
+    # The reduced exponents and q^-1 mod p depend only on the key, so
+    # they are computed once per key and reused across decryptions
+    dp, dq, q_inv = _crt_params(d, p, q)
     
     m1 = power_mod_fast(ciphertext, dp, p)
     m2 = power_mod_fast(ciphertext, dq, q)
@@ -280,6 +339,12 @@ def rsa_decrypt_crt(ciphertext, private_key, p, q):
     return m
 
 
+@lru_cache(maxsize=None)
+def _crt_params(d, p, q):
+    """Precompute the per-key CRT constants (dp, dq, q^-1 mod p)."""
+    return d % (p - 1), d % (q - 1), pow(q, -1, p)
+
+
 def demonstrate_modular_exponentiation():
     """Demonstrate different methods of modular exponentiation."""
     print(f"\n{'=' * 70}")
@@ -304,31 +369,39 @@ def demonstrate_modular_exponentiation():
     print(f"{'=' * 70}")
     
     base, exp_small, mod = 123, 100, 10000
-    
+
     print(f"\nComputing {base}^{exp_small} mod {mod}")
-    
-    start = time.time()
-    result_naive = power_mod_naive(base, exp_small, mod)
-    time_naive = time.time() - start
-    
-    start = time.time()
-    result_fast = power_mod_fast(base, exp_small, mod)
-    time_fast = time.time() - start
-    
-    print(f"  Naive method: {result_naive} (Time: {time_naive*1000:.4f} ms)")
-    print(f"  Fast method:  {result_fast} (Time: {time_fast*1000:.4f} ms)")
+
+    # Timing a single call mostly measures clock resolution and call
+    # overhead, so run many iterations on the high-resolution counter
+    # and report the per-call average
+    rounds = 10000
+
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        result_naive = power_mod_naive(base, exp_small, mod)
+    time_naive = (time.perf_counter_ns() - start) / rounds
+
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        result_fast = power_mod_fast(base, exp_small, mod)
+    time_fast = (time.perf_counter_ns() - start) / rounds
+
+    print(f"  Naive method: {result_naive} (Time: {time_naive/1e6:.4f} ms)")
+    print(f"  Fast method:  {result_fast} (Time: {time_fast/1e6:.4f} ms)")
     print(f"  Speedup: {time_naive/time_fast:.1f}x")
-    
+
     # Demonstrate with very large exponent (fast method only)
     print(f"\nComputing with large exponent (fast method only):")
     base, exp_large, mod = 2, 10000, 1000000007
-    
-    start = time.time()
-    result = power_mod_fast(base, exp_large, mod)
-    elapsed = time.time() - start
-    
+
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        result = power_mod_fast(base, exp_large, mod)
+    elapsed = (time.perf_counter_ns() - start) / rounds
+
     print(f"  {base}^{exp_large} mod {mod} = {result}")
-    print(f"  Time: {elapsed*1000:.4f} ms")
+    print(f"  Time: {elapsed/1e6:.4f} ms")
     
     print(f"\n{'=' * 70}")
 
@@ -360,13 +433,16 @@ def demonstrate_rsa():
     
     messages = [42, 1234, 9999, 12345]
     
+    # Encrypt every message that fits in one batch under the shared key
+    valid = [msg for msg in messages if msg < n]
+    ciphertexts = dict(zip(valid, rsa_encrypt_batch(valid, public_key)))
+    
     for msg in messages:
         if msg >= n:
             print(f"\nMessage {msg} is too large (must be < {n})")
             continue
         
-        # Encrypt
-        ciphertext = rsa_encrypt(msg, public_key)
+        ciphertext = ciphertexts[msg]
         
         # Decrypt (standard)
         decrypted = rsa_decrypt(ciphertext, private_key)
@@ -389,20 +465,20 @@ def demonstrate_rsa():
     test_cipher = rsa_encrypt(test_msg, public_key)
     
     # Standard decryption
-    start = time.time()
+    start = time.perf_counter_ns()
     for _ in range(100):
         rsa_decrypt(test_cipher, private_key)
-    time_standard = time.time() - start
-    
+    time_standard = time.perf_counter_ns() - start
+
     # CRT decryption
-    start = time.time()
+    start = time.perf_counter_ns()
     for _ in range(100):
         rsa_decrypt_crt(test_cipher, private_key, p, q)
-    time_crt = time.time() - start
-    
+    time_crt = time.perf_counter_ns() - start
+
     print(f"\n100 decryptions:")
-    print(f"  Standard method: {time_standard*1000:.2f} ms")
-    print(f"  CRT method: {time_crt*1000:.2f} ms")
+    print(f"  Standard method: {time_standard/1e6:.2f} ms")
+    print(f"  CRT method: {time_crt/1e6:.2f} ms")
     print(f"  Speedup: {time_standard/time_crt:.2f}x")
     
     print(f"\n{'=' * 70}")
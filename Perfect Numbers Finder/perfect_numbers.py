@@ -8,6 +8,35 @@ positive integer that is equal to the sum of its proper positive divisors
 Example: 6 = 1 + 2 + 3 (divisors: 1, 2, 3)
 """
 
+import math
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _proper_divisor_sum(n):
+    """
+    Sum the proper divisors of n without building a list.
+    
+    One pass to the integer square root adds each divisor pair directly,
+    so the hot classification loops skip the list allocation and sort
+    that get_divisors pays for display purposes.
+    
+    Args:
+        n: Positive integer (n >= 2)
+    
+    Returns:
+        Sum of the divisors of n excluding n itself
+    """
+    total = 1  # 1 divides everything; n itself is excluded
+    root = math.isqrt(n)
+    for i in range(2, root + 1):
+        if n % i == 0:
+            total += i + n // i
+    if root * root == n and root > 1:
+        total -= root  # perfect square: the root was counted twice
+    return total
+
+
 def get_divisors(n):
     """
     Get all divisors of a number.
@@ -18,17 +47,28 @@ def get_divisors(n):
     Returns:
         List of divisors
     """
+    # A fresh list per call keeps the cached result safe from mutation
+    return list(_divisors_cached(n))
+
+
+@lru_cache(maxsize=None)
+def _divisors_cached(n):
+    """Cached core of get_divisors, returning an immutable tuple."""
     if n < 1:
-        return []
-    
-    divisors = []
-    for i in range(1, int(n ** 0.5) + 1):
+        return ()
+
+    # Collect the two halves of each divisor pair separately: low is
+    # already ascending and high descending, so reversing and
+    # concatenating yields sorted output with no final sort
+    low = []
+    high = []
+    for i in range(1, math.isqrt(n) + 1):
         if n % i == 0:
-            divisors.append(i)
+            low.append(i)
             if i != n // i and i != n:
-                divisors.append(n // i)
-    
-    return sorted(divisors)
+                high.append(n // i)
+
+    return tuple(low) + tuple(high[::-1])
 
 
 def get_proper_divisors(n):
@@ -58,8 +98,7 @@ def is_perfect(n):
     if n < 2:
         return False
     
-    proper_divisors = get_proper_divisors(n)
-    return sum(proper_divisors) == n
+    return _proper_divisor_sum(n) == n
 
 
 def classify_number(n):
@@ -79,8 +118,7 @@ def classify_number(n):
     if n < 2:
         return "Invalid"
     
-    proper_divisors = get_proper_divisors(n)
-    divisor_sum = sum(proper_divisors)
+    divisor_sum = _proper_divisor_sum(n)
     
     if divisor_sum == n:
         return "Perfect"
@@ -100,13 +138,15 @@ def find_perfect_numbers(limit):
     Returns:
         List of perfect numbers
     """
-    perfect_numbers = []
-    
-    for n in range(2, limit + 1):
-        if is_perfect(n):
-            perfect_numbers.append(n)
-    
-    return perfect_numbers
+    # Sigma sieve: credit every divisor d to all its multiples at once.
+    # O(N log N) additions for the whole range versus O(N * sqrt(N))
+    # trial divisions when each n is tested on its own.
+    sigma = [0] * (limit + 1)
+    for d in range(1, limit // 2 + 1):
+        for multiple in range(2 * d, limit + 1, d):
+            sigma[multiple] += d
+
+    return [n for n in range(2, limit + 1) if sigma[n] == n]
 
 
 def find_perfect_numbers_euclid(limit):
@@ -124,12 +164,13 @@ def find_perfect_numbers_euclid(limit):
     def is_prime(n):
         if n < 2:
             return False
-        if n == 2:
+        if n < 4:
             return True
-        if n % 2 == 0:
+        if n % 2 == 0 or n % 3 == 0:
             return False
-        for i in range(3, int(n ** 0.5) + 1, 2):
-            if n % i == 0:
+        # 6k±1 wheel: primes above 3 only occur at these residues
+        for i in range(5, math.isqrt(n) + 1, 6):
+            if n % i == 0 or n % (i + 2) == 0:
                 return False
         return True
     
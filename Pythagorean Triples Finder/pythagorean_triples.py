@@ -5,28 +5,35 @@ Finds all Pythagorean triples (a, b, c) where a^2 + b^2 = c^2
 and a, b, c are positive integers up to a given limit.
 """
 
+import math
+
+
 def find_pythagorean_triples(max_value):
     """
     Find all Pythagorean triples where a, b, c <= max_value.
-    
+
     Args:
         max_value: Maximum value for any side of the triangle
-    
+
     Returns:
         List of tuples (a, b, c) representing Pythagorean triples
     """
     triples = []
-    
-    # Generate all possible combinations
+
+    # Map c² -> c once, so each candidate pair costs one dict probe
+    # instead of a float sqrt plus the round-trip check
+    squares = {c * c: c for c in range(1, max_value + 1)}
+    limit_squared = max_value * max_value
+
     for a in range(1, max_value + 1):
-        for b in range(a, max_value + 1):  # Start from a to avoid duplicates
-            c_squared = a**2 + b**2
-            c = int(c_squared ** 0.5)
-            
-            # Check if c is an integer and within our limit
-            if c * c == c_squared and c <= max_value:
+        a_squared = a * a
+        # c <= max_value caps b at √(max_value² - a²), shrinking the
+        # inner range instead of filtering oversized c afterwards
+        for b in range(a, math.isqrt(limit_squared - a_squared) + 1):
+            c = squares.get(a_squared + b * b)
+            if c is not None:
                 triples.append((a, b, c))
-    
+
     return triples
 
 
@@ -40,24 +47,24 @@ def find_primitive_triples(max_value):
     Returns:
         List of tuples (a, b, c) representing primitive Pythagorean triples
     """
-    def gcd(x, y):
-        """Calculate greatest common divisor using Euclidean algorithm."""
-        while y:
-            x, y = y, x % y
-        return x
-    
-    def gcd_three(a, b, c):
-        """Calculate gcd of three numbers."""
-        return gcd(gcd(a, b), c)
-    
-    all_triples = find_pythagorean_triples(max_value)
+    # Euclid's formula: coprime m > n of opposite parity generate every
+    # primitive triple as (m² - n², 2mn, m² + n²) exactly once, so no
+    # full search and no gcd filter over composite triples is needed
     primitive = []
-    
-    for triple in all_triples:
-        a, b, c = triple
-        if gcd_three(a, b, c) == 1:
-            primitive.append(triple)
-    
+
+    m = 2
+    while m * m + 1 <= max_value:
+        for n in range(1, m):
+            if (m - n) % 2 == 1 and math.gcd(m, n) == 1:
+                c = m * m + n * n
+                if c <= max_value:
+                    a, b = m * m - n * n, 2 * m * n
+                    if a > b:
+                        a, b = b, a
+                    primitive.append((a, b, c))
+        m += 1
+
+    primitive.sort()
     return primitive
 
 
@@ -10,34 +10,63 @@ and demonstrates connections to prime number distribution.
 
 import math
 import cmath
+from functools import lru_cache
+
+# Bernoulli numbers B_2, B_4, ..., B_14 for the Euler-Maclaurin tail
+_BERNOULLI = (1 / 6, -1 / 30, 1 / 42, -1 / 30, 5 / 66, -691 / 2730, 7 / 6)
+
+
+@lru_cache(maxsize=4)
+def _log_n(terms):
+    """log(n) for n = 1..terms, shared by every evaluation at that length.
+
+    The logarithms never depend on s, so the critical-line sweep reuses
+    one table instead of recomputing log(n) inside each n^(-s).
+    """
+    return tuple(math.log(n) for n in range(1, terms + 1))
 
 
 def zeta_dirichlet(s, terms=10000):
     """
-    Compute the Riemann Zeta function using Dirichlet series.
-    
+    Compute the Riemann Zeta function via Euler-Maclaurin summation.
+
     ζ(s) = Σ(n=1 to ∞) 1/n^s
-    
-    Converges for Re(s) > 1. For computational efficiency, uses finite sum.
-    
+
+    The truncated Dirichlet series alone gains barely a digit per decade
+    of extra terms near Re(s) = 1. Summing a short partial series and
+    closing it with the Euler-Maclaurin tail (integral term, half term
+    and Bernoulli corrections) reaches near machine precision from a few
+    dozen terms, and stays valid on and left of Re(s) = 1.
+
     Args:
         s: Complex number or real number
-        terms: Number of terms in the series
-    
+        terms: Cap on the partial-series length
+
     Returns:
         Complex approximation of ζ(s)
     """
     if isinstance(s, (int, float)):
         s = complex(s, 0)
-    
+
     # Handle special case s = 1 (pole)
     if abs(s - 1) < 1e-10:
         return complex(float('inf'), 0)
-    
-    result = 0
-    for n in range(1, terms + 1):
-        result += 1 / (n ** s)
-    
+
+    # Partial sum cutoff: a handful of terms suffices, growing with the
+    # oscillation rate |Im(s)|
+    cutoff = min(terms, max(16, int(abs(s.imag)) + 16))
+
+    result = sum(1 / (n ** s) for n in range(1, cutoff))
+    result += cutoff ** (1 - s) / (s - 1) + 0.5 * cutoff ** (-s)
+
+    # Bernoulli corrections: B_2k/(2k)! * (s)_(2k-1) * cutoff^(1-s-2k)
+    rising = s
+    power = cutoff ** (-s - 1)
+    for k, bernoulli in enumerate(_BERNOULLI, start=1):
+        result += bernoulli / math.factorial(2 * k) * rising * power
+        rising *= (s + 2 * k - 1) * (s + 2 * k)
+        power /= cutoff * cutoff
+
     return result
 
 
@@ -61,27 +90,27 @@ def zeta_euler_product(s, num_primes=1000):
     
     primes = sieve_of_eratosthenes(num_primes)
     
-    result = 1.0
-    for p in primes:
-        result *= 1 / (1 - p ** (-s))
-    
-    return result
+    # math.prod folds the product in C, in the same left-to-right order
+    return math.prod((1 / (1 - p ** (-s)) for p in primes), start=1.0)
 
 
+@lru_cache(maxsize=8)
 def sieve_of_eratosthenes(limit):
-    """Find all prime numbers up to limit."""
+    """Find all prime numbers up to limit (cached per limit)."""
     if limit < 2:
-        return []
+        return ()
     
-    is_prime = [True] * (limit + 1)
-    is_prime[0] = is_prime[1] = False
-    
-    for i in range(2, int(limit ** 0.5) + 1):
+    # bytearray flags: crossing off multiples is a C-level slice write
+    # instead of a Python loop per prime
+    is_prime = bytearray([1]) * (limit + 1)
+    is_prime[0] = is_prime[1] = 0
+
+    for i in range(2, math.isqrt(limit) + 1):
         if is_prime[i]:
-            for j in range(i * i, limit + 1, i):
-                is_prime[j] = False
-    
-    return [i for i in range(2, limit + 1) if is_prime[i]]
+            is_prime[i * i::i] = bytes(len(is_prime[i * i::i]))
+
+    # Tuple result: immutable, so the cached value is safe to share
+    return tuple(i for i in range(2, limit + 1) if is_prime[i])
 
 
 def zeta_functional_equation(s, terms=1000):
@@ -124,40 +153,61 @@ def zeta_functional_equation(s, terms=1000):
     
     # For 0 < Re(s) < 1, use alternating series (Dirichlet eta function)
     # η(s) = (1 - 2^(1-s)) ζ(s) = Σ (-1)^(n+1) / n^s
-    eta = 0
-    for n in range(1, terms + 1):
-        eta += ((-1) ** (n + 1)) / (n ** s)
+    # n^(-s) = exp(-s log n) with the log table precomputed once per
+    # terms value; negating every other term replaces the per-term
+    # (-1)**(n+1) power and unary minus is exact
+    logs = _log_n(terms)
+    exp = cmath.exp
+    series = [exp(-s * ln) if n & 1 else -exp(-s * ln)
+              for n, ln in enumerate(logs, start=1)]
+    # Compensated summation of each component: thousands of alternating
+    # terms otherwise accumulate cancellation error near the zeros,
+    # exactly where the sign of Im(eta) decides the bracketing
+    eta = complex(math.fsum(z.real for z in series),
+                  math.fsum(z.imag for z in series))
     
     zeta_s = eta / (1 - 2 ** (1 - s))
     return zeta_s
 
 
+# Lanczos coefficients (g = 7, 9 terms) for the complex Gamma function
+_LANCZOS_G = 7
+_LANCZOS_COEFFS = (
+    0.99999999999980993, 676.5203681218851, -1259.1392167224028,
+    771.32342877765313, -176.61502916214059, 12.507343278686905,
+    -0.13857109526572012, 9.9843695780195716e-6, 1.5056327351493116e-7,
+)
+
+
 def gamma_stirling(s):
     """
-    Approximate Gamma function using Stirling's formula.
-    
-    Γ(s) ≈ √(2π/s) * (s/e)^s
-    
+    Compute the Gamma function via the Lanczos approximation.
+
+    The low-order Stirling formula this replaced lost several digits for
+    small |s|; the Lanczos series is accurate to ~13 significant digits
+    across the complex plane (math.gamma only covers real arguments).
+
     Args:
         s: Complex number
-    
+
     Returns:
         Complex approximation of Γ(s)
     """
     if isinstance(s, (int, float)):
         s = complex(s, 0)
-    
+
     # Use reflection formula for Re(s) < 0.5
     if s.real < 0.5:
         # Γ(s)Γ(1-s) = π/sin(πs)
         return math.pi / (cmath.sin(math.pi * s) * gamma_stirling(1 - s))
-    
-    # Stirling's approximation
-    e = math.e
-    pi = math.pi
-    
-    result = cmath.sqrt(2 * pi / s) * ((s / e) ** s)
-    return result
+
+    s -= 1
+    series = _LANCZOS_COEFFS[0]
+    for i in range(1, len(_LANCZOS_COEFFS)):
+        series += _LANCZOS_COEFFS[i] / (s + i)
+
+    t = s + _LANCZOS_G + 0.5
+    return cmath.sqrt(2 * math.pi) * t ** (s + 0.5) * cmath.exp(-t) * series
 
 
 def find_zeros_critical_line(t_start, t_end, step=0.1):
@@ -174,59 +224,74 @@ def find_zeros_critical_line(t_start, t_end, step=0.1):
     Returns:
         List of (t, |ζ(1/2 + it)|) tuples for potential zeros
     """
-    zeros = []
+    # Evaluate the whole grid up front, then scan adjacent pairs: the
+    # sign test needs only the stored imaginary parts, and every grid
+    # point is computed exactly once
+    grid = []
     t = t_start
-    prev_sign = None
-    
     while t <= t_end:
-        s = complex(0.5, t)
-        zeta_val = zeta_functional_equation(s, terms=5000)
-        
-        # Check for sign change in imaginary part
-        current_sign = 1 if zeta_val.imag > 0 else -1
-        
-        if prev_sign is not None and current_sign != prev_sign:
-            # Refine the zero using bisection
-            t_refined = bisection_zero(t - step, t, num_iterations=20)
+        grid.append(t)
+        t += step
+
+    signs = [1 if zeta_functional_equation(complex(0.5, t), terms=5000).imag > 0
+             else -1 for t in grid]
+
+    zeros = []
+    for i in range(1, len(grid)):
+        if signs[i] != signs[i - 1]:
+            # Refine the bracketed zero with guarded secant steps
+            t_refined = secant_zero(grid[i] - step, grid[i])
             s_zero = complex(0.5, t_refined)
             zeta_at_zero = zeta_functional_equation(s_zero, terms=5000)
             magnitude = abs(zeta_at_zero)
-            
+
             if magnitude < 0.01:  # Threshold for considering it a zero
                 zeros.append((t_refined, magnitude))
-        
-        prev_sign = current_sign
-        t += step
-    
+
     return zeros
 
 
-def bisection_zero(t_low, t_high, num_iterations=20):
+def secant_zero(t_low, t_high, num_iterations=12, tol=1e-12):
     """
-    Refine zero location using bisection on imaginary part of ζ(1/2 + it).
-    
+    Refine a bracketed zero of Im ζ(1/2 + it) with guarded secant steps.
+
+    The secant update converges superlinearly, so a dozen evaluations
+    pin the zero to machine precision where bisection's one bit per
+    step needed ~40. A proposed step that would leave the bracket falls
+    back to the midpoint, so the zero always stays enclosed.
+
     Args:
-        t_low: Lower bound
+        t_low: Lower bound (sign change of Im ζ between the bounds)
         t_high: Upper bound
-        num_iterations: Number of bisection iterations
-    
+        num_iterations: Cap on refinement steps
+        tol: Bracket width at which to stop early
+
     Returns:
         Refined value of t
     """
+    f_low = zeta_functional_equation(complex(0.5, t_low), terms=5000).imag
+    f_high = zeta_functional_equation(complex(0.5, t_high), terms=5000).imag
+
     for _ in range(num_iterations):
-        t_mid = (t_low + t_high) / 2
-        s_mid = complex(0.5, t_mid)
-        zeta_mid = zeta_functional_equation(s_mid, terms=5000)
-        
-        s_low = complex(0.5, t_low)
-        zeta_low = zeta_functional_equation(s_low, terms=5000)
-        
-        if zeta_low.imag * zeta_mid.imag < 0:
-            t_high = t_mid
+        if f_high != f_low:
+            t_new = t_high - f_high * (t_high - t_low) / (f_high - f_low)
         else:
-            t_low = t_mid
-    
-    return (t_low + t_high) / 2
+            t_new = (t_low + t_high) / 2
+        if not t_low < t_new < t_high:
+            t_new = (t_low + t_high) / 2
+
+        f_new = zeta_functional_equation(complex(0.5, t_new), terms=5000).imag
+
+        if f_low * f_new < 0:
+            t_high, f_high = t_new, f_new
+        else:
+            t_low, f_low = t_new, f_new
+
+        if t_high - t_low < tol:
+            break
+
+    # Report whichever endpoint sits closer to the axis crossing
+    return t_low if abs(f_low) < abs(f_high) else t_high
 
 
 def special_zeta_values():
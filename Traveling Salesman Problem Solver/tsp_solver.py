@@ -45,12 +45,19 @@ def calculate_distance_matrix(cities: List[Tuple[float, float]]) -> List[List[fl
     """
     n = len(cities)
     distances = [[0.0] * n for _ in range(n)]
-    
+
+    # The matrix is symmetric, so compute each pair once and write both
+    # entries; unpacking city i's coordinates outside the inner loop
+    # drops the per-pair tuple indexing and function call
     for i in range(n):
-        for j in range(n):
-            if i != j:
-                distances[i][j] = euclidean_distance(cities[i], cities[j])
-    
+        x1, y1 = cities[i]
+        row = distances[i]
+        for j in range(i + 1, n):
+            x2, y2 = cities[j]
+            d = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+            row[j] = d
+            distances[j][i] = d
+
     return distances
 
 
@@ -65,47 +72,64 @@ def tour_distance(tour: List[int], distances: List[List[float]]) -> float:
     Returns:
         Total distance of the tour
     """
-    total = 0.0
-    n = len(tour)
-    
-    for i in range(n):
-        total += distances[tour[i]][tour[(i + 1) % n]]
-    
-    return total
+    # Pairing consecutive cities with zip lets the C-level sum drive the
+    # iteration: no index arithmetic, no modulo, one generator step per
+    # edge instead of four bytecode-dispatched subscript operations.
+    # islice walks the same list one element ahead, so no tour[1:] copy
+    # is allocated per evaluation
+    total = sum(distances[a][b]
+                for a, b in zip(tour, itertools.islice(tour, 1, None)))
+    return total + distances[tour[-1]][tour[0]]
 
 
 def brute_force_tsp(distances: List[List[float]]) -> Tuple[List[int], float]:
     """
     Solve TSP by checking all possible tours (exact solution).
     
-    Enumerates all (n-1)!/2 possible tours and returns the shortest.
-    Only practical for small n (≤ 10).
-    
+    Explores the (n-1)! tour prefixes depth-first, pruning any branch
+    whose partial length already meets the best complete tour found so
+    far; a nearest-neighbor tour seeds the bound so pruning bites from
+    the first branch. Still exact, still only practical for small n.
+
     Args:
         distances: Distance matrix
-    
+
     Returns:
         (best_tour, best_distance) tuple
     """
     n = len(distances)
-    cities = list(range(n))
-    
+
+    # A greedy tour gives a tight initial upper bound for pruning
+    best_tour, best_distance = nearest_neighbor_tsp(distances)
+
+    path = [0]
+    full_mask = (1 << n) - 1
+
+    def extend(used, partial):
+        nonlocal best_tour, best_distance
+
+        if used == full_mask:
+            total = partial + distances[path[-1]][0]
+            if total < best_distance:
+                best_distance = total
+                best_tour = path[:]
+            return
+
+        last_row = distances[path[-1]]
+        for city in range(1, n):
+            bit = 1 << city
+            if used & bit:
+                continue
+            extended = partial + last_row[city]
+            if extended >= best_distance:
+                continue  # This prefix can no longer beat the best tour
+            path.append(city)
+            extend(used | bit, extended)
+            path.pop()
+
     # Fix first city to reduce symmetry (all tours start from city 0)
-    first_city = cities[0]
-    remaining_cities = cities[1:]
-    
-    best_tour = None
-    best_distance = float('inf')
-    
-    # Try all permutations
-    for perm in itertools.permutations(remaining_cities):
-        tour = [first_city] + list(perm)
-        distance = tour_distance(tour, distances)
-        
-        if distance < best_distance:
-            best_distance = distance
-            best_tour = tour
-    
+    extend(1, 0.0)
+
     return best_tour, best_distance
 
 
@@ -125,66 +149,87 @@ def held_karp_tsp(distances: List[List[float]]) -> Tuple[List[int], float]:
         (best_tour, best_distance) tuple
     """
     n = len(distances)
-    
-    # memo[subset][last] = (cost, prev) where:
-    # - subset: bitmask of visited cities
+    INF = float('inf')
+
+    # Flat state tables indexed by bits * n + last instead of a dict
+    # keyed on (bitmask, last) tuples: no tuple hashing per lookup, and
+    # an unreached state is simply an inf entry
+    # - bits: bitmask of visited cities
     # - last: last city in the tour
     # - cost: minimum cost to reach this state
-    # - prev: previous city in optimal path
-    memo = {}
-    
+    # - parent: previous city in optimal path
+    cost = [INF] * ((1 << n) * n)
+    parent = [-1] * ((1 << n) * n)
+
     # Base case: tours of length 1 starting from city 0
     for i in range(1, n):
-        memo[(1 << i, i)] = (distances[0][i], 0)
-    
-    # Build up tours of increasing size
+        cost[(1 << i) * n + i] = distances[0][i]
+        parent[(1 << i) * n + i] = 0
+
+    # Build up tours of increasing size. Gosper's hack walks the masks
+    # of each popcount directly, so no tuples are allocated and no
+    # per-subset bitmask reconstruction is needed; cities live in bits
+    # 1..n-1 (city 0 is always the tour start)
+    top = 1 << (n - 1)
     for subset_size in range(2, n):
-        for subset in itertools.combinations(range(1, n), subset_size):
-            # Create bitmask for this subset
-            bits = 0
-            for bit in subset:
-                bits |= 1 << bit
-            
+        v = (1 << subset_size) - 1
+        while v < top:
+            bits = v << 1
+            base = bits * n
+
             # Try each city as the last in the tour
-            for last in subset:
-                prev_bits = bits & ~(1 << last)
-                best = float('inf')
+            remaining = bits
+            while remaining:
+                last_bit = remaining & -remaining
+                remaining ^= last_bit
+                last = last_bit.bit_length() - 1
+                prev_bits = bits ^ last_bit
+                prev_base = prev_bits * n
+                dist_to_last = distances[last]
+                best = INF
                 best_prev = -1
-                
+
                 # Try each possible previous city
-                for prev in subset:
-                    if prev == last:
-                        continue
-                    if (prev_bits, prev) in memo:
-                        cost = memo[(prev_bits, prev)][0] + distances[prev][last]
-                        if cost < best:
-                            best = cost
-                            best_prev = prev
-                
-                if best < float('inf'):
-                    memo[(bits, last)] = (best, best_prev)
-    
+                others = prev_bits
+                while others:
+                    prev_bit = others & -others
+                    others ^= prev_bit
+                    prev = prev_bit.bit_length() - 1
+                    candidate = cost[prev_base + prev] + dist_to_last[prev]
+                    if candidate < best:
+                        best = candidate
+                        best_prev = prev
+
+                if best < INF:
+                    cost[base + last] = best
+                    parent[base + last] = best_prev
+
+            # Gosper's hack: smallest mask above v with the same popcount
+            c = v & -v
+            r = v + c
+            v = (((r ^ v) >> 2) // c) | r
+
     # Find the optimal tour
     all_bits = (1 << n) - 2  # All cities except 0
-    best_distance = float('inf')
+    all_base = all_bits * n
+    best_distance = INF
     best_last = -1
-    
+
     for last in range(1, n):
-        if (all_bits, last) in memo:
-            cost = memo[(all_bits, last)][0] + distances[last][0]
-            if cost < best_distance:
-                best_distance = cost
-                best_last = last
-    
+        candidate = cost[all_base + last] + distances[last][0]
+        if candidate < best_distance:
+            best_distance = candidate
+            best_last = last
+
     # Reconstruct the tour
     tour = []
     bits = all_bits
     current = best_last
-    
+
     while current != -1:
         tour.append(current)
-        if (bits, current) in memo:
-            prev = memo[(bits, current)][1]
+        if cost[bits * n + current] < INF:
+            prev = parent[bits * n + current]
             bits &= ~(1 << current)
             current = prev
         else:
@@ -221,8 +266,9 @@ def nearest_neighbor_tsp(distances: List[List[float]],
     current = start
     
     while unvisited:
-        # Find nearest unvisited city
-        nearest = min(unvisited, key=lambda city: distances[current][city])
+        # Find nearest unvisited city; the row's bound __getitem__ saves
+        # a lambda frame and a matrix subscript per candidate
+        nearest = min(unvisited, key=distances[current].__getitem__)
         tour.append(nearest)
         unvisited.remove(nearest)
         current = nearest
@@ -250,34 +296,34 @@ def two_opt_improve(tour: List[int], distances: List[List[float]],
         (improved_tour, improved_distance) tuple
     """
     best_tour = tour[:]
-    best_distance = tour_distance(best_tour, distances)
+    n = len(best_tour)
     improved = True
     iteration = 0
-    
+
     while improved and iteration < max_iterations:
         improved = False
         iteration += 1
-        
-        for i in range(1, len(best_tour) - 2):
-            for j in range(i + 1, len(best_tour)):
-                if j - i == 1:
-                    continue  # Adjacent edges, no improvement
-                
-                # Try reversing the segment [i:j]
-                new_tour = best_tour[:]
-                new_tour[i:j] = reversed(new_tour[i:j])
-                new_distance = tour_distance(new_tour, distances)
-                
-                if new_distance < best_distance:
-                    best_tour = new_tour
-                    best_distance = new_distance
+
+        for i in range(1, n - 2):
+            # Reversing [i:j] only replaces the two edges at the segment
+            # boundaries, so the length change is four distance lookups
+            # instead of a full-tour copy and re-evaluation
+            a, b = best_tour[i - 1], best_tour[i]
+            for j in range(i + 2, n):
+                c, d = best_tour[j - 1], best_tour[j]
+                delta = (distances[a][c] + distances[b][d]
+                         - distances[a][b] - distances[c][d])
+
+                if delta < -1e-12:
+                    # Improvement found: reverse the segment in place
+                    best_tour[i:j] = best_tour[i:j][::-1]
                     improved = True
                     break
-            
+
             if improved:
                 break
-    
-    return best_tour, best_distance
+
+    return best_tour, tour_distance(best_tour, distances)
 
 
 def simulated_annealing_tsp(distances: List[List[float]], 
@@ -301,34 +347,30 @@ def simulated_annealing_tsp(distances: List[List[float]],
         (best_tour, best_distance) tuple
     """
     n = len(distances)
-    
+
     # Start with random tour
     current_tour = list(range(n))
     random.shuffle(current_tour[1:])  # Keep first city fixed
     current_distance = tour_distance(current_tour, distances)
-    
+
     best_tour = current_tour[:]
     best_distance = current_distance
-    
+
     temperature = initial_temp
-    
+
     while temperature > min_temp:
-        # Generate neighbor by swapping two random cities
-        new_tour = current_tour[:]
+        # Generate neighbor by swapping two random cities; the length
+        # change only involves the edges touching the two positions, so
+        # it costs a handful of lookups instead of an O(n) re-evaluation
         i = random.randint(1, n - 1)
         j = random.randint(1, n - 1)
-        new_tour[i], new_tour[j] = new_tour[j], new_tour[i]
-        
-        new_distance = tour_distance(new_tour, distances)
-        
-        # Calculate acceptance probability
-        delta = new_distance - current_distance
-        
+        delta = _swap_delta(current_tour, distances, i, j)
+
         if delta < 0:
             # Better solution - always accept
-            current_tour = new_tour
-            current_distance = new_distance
-            
+            current_tour[i], current_tour[j] = current_tour[j], current_tour[i]
+            current_distance += delta
+
             if current_distance < best_distance:
                 best_tour = current_tour[:]
                 best_distance = current_distance
@@ -336,15 +378,53 @@ def simulated_annealing_tsp(distances: List[List[float]],
             # Worse solution - accept with probability exp(-delta/T)
             acceptance_prob = math.exp(-delta / temperature)
             if random.random() < acceptance_prob:
-                current_tour = new_tour
-                current_distance = new_distance
-        
+                current_tour[i], current_tour[j] = current_tour[j], current_tour[i]
+                current_distance += delta
+
         # Cool down
         temperature *= cooling_rate
-    
+
     return best_tour, best_distance
 
 
+def _swap_delta(tour: List[int], distances: List[List[float]],
+                i: int, j: int) -> float:
+    """
+    Tour-length change from swapping the cities at positions i and j.
+
+    Only the edges incident to the two positions move, so the delta is
+    at most eight distance lookups (six when the positions are
+    adjacent, where the shared edge keeps its length).
+
+    Args:
+        tour: Current tour
+        distances: Distance matrix
+        i, j: Positions to swap (both >= 1; position 0 stays fixed)
+
+    Returns:
+        New tour length minus current tour length
+    """
+    if i == j:
+        return 0.0
+    if i > j:
+        i, j = j, i
+
+    n = len(tour)
+    a, b = tour[i], tour[j]
+    i_prev, i_next = tour[i - 1], tour[i + 1]
+    j_prev, j_next = tour[j - 1], tour[(j + 1) % n]
+
+    if j - i == 1:
+        # Adjacent positions: the edge between a and b survives the swap
+        return (distances[i_prev][b] + distances[a][j_next]
+                - distances[i_prev][a] - distances[b][j_next])
+
+    return (distances[i_prev][b] + distances[b][i_next]
+            + distances[j_prev][a] + distances[a][j_next]
+            - distances[i_prev][a] - distances[a][i_next]
+            - distances[j_prev][b] - distances[b][j_next])
+
+
 def generate_random_cities(n: int, max_coord: int = 100) -> List[Tuple[float, float]]:
     """
     Generate random city coordinates.
@@ -362,13 +442,6 @@ def generate_random_cities(n: int, max_coord: int = 100) -> List[Tuple[float, fl
     return cities
 
 
-def factorial(n: int) -> int:
-    """Calculate factorial."""
-    if n <= 1:
-        return 1
-    return n * factorial(n - 1)
-
-
 def main():
     """Demonstrate TSP solving with multiple algorithms."""
     
@@ -383,8 +456,8 @@ def main():
     distances = calculate_distance_matrix(cities)
     
     print(f"\nProblem Size: {num_cities} cities")
-    print(f"Possible tours: {factorial(num_cities - 1) // 2:,}")
-    print(f"(That's {factorial(num_cities - 1) // 2} different routes to check!)")
+    print(f"Possible tours: {math.factorial(num_cities - 1) // 2:,}")
+    print(f"(That's {math.factorial(num_cities - 1) // 2} different routes to check!)")
     
     # Show sample cities
     print("\nSample Cities (x, y coordinates):")
@@ -522,7 +595,7 @@ def main():
     print("=" * 70)
     
     print(f"\nFor {num_cities} cities:")
-    print(f"  Brute Force:       O(n!) = O({num_cities}!) = {factorial(num_cities):,} operations")
+    print(f"  Brute Force:       O(n!) = O({num_cities}!) = {math.factorial(num_cities):,} operations")
     print(f"  Dynamic Prog:      O(n²·2ⁿ) = O({num_cities}²·2^{num_cities}) ≈ {num_cities**2 * 2**num_cities:,} operations")
     print(f"  Nearest Neighbor:  O(n²) = O({num_cities}²) = {num_cities**2:,} operations")
     print(f"  2-Opt:             O(n²) per iteration")